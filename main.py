@@ -9,11 +9,16 @@ Functions:
 """
 
 import os
+from contextlib import closing
 from pathlib import Path
 
 from src.analysis.article_analyzer import ArticleAnalyzer
 from src.analysis.topic_analysis import analyze_topics, export_top_topics_to_csv
-from src.database.database_operations import get_article_analysis_topics_by_sentiment
+from src.database.connection import get_connection
+from src.database.database_operations import (
+    close_all,
+    iterate_article_topics_by_sentiment,
+)
 from src.processors.data_collection import collect_the_data
 
 
@@ -22,8 +27,8 @@ def main():
     Main function to perform the following tasks:
     1. Collect data from email attachments and save it to an SQLite database.
     2. Analyze articles and save the analysis data to the database.
-    3. Collect negative sentiment articles, drop the article_text column, and export the top topics
-       to a CSV file.
+    3. Collect negative sentiment articles without their article_text column, and export the top
+       topics to a CSV file.
     Steps:
     - Set up the data folder and database path.
     - Collect data from email attachments.
@@ -42,17 +47,17 @@ def main():
 
     # Analyze articles
     model_path = os.path.join(Path(__file__).parent, "models")
-    analyzer = ArticleAnalyzer(db_path, model_path)
-    analyzer.analyze_and_save_articles()
-    print("Analysis data has been saved to the database.")
+    analyzer = ArticleAnalyzer(db_path, model_path, quantize=True)
+    with closing(get_connection(db_path)) as conn:
+        analyzer.analyze_and_save_articles(conn)
+        print("Analysis data has been saved to the database.")
 
-    # Collect the negative sentiment articles and drop the article_text column
-    articles = [
-        (title, topics)
-        for title, _, topics in get_article_analysis_topics_by_sentiment(
-            db_path, sentiment="negative"
+        # Collect the negative sentiment articles without reading the article_text column
+        articles = list(
+            iterate_article_topics_by_sentiment(
+                db_path, sentiment="negative", conn=conn
+            )
         )
-    ]
 
     filename = "top_topics.csv"
     word_counts = analyze_topics(articles)
@@ -66,6 +71,9 @@ def main():
 
     print(f"Top topics have been saved to '{filename}'.")
 
+    # Close the connections cached by the database operations
+    close_all()
+
 
 if __name__ == "__main__":
     main()
@@ -1,13 +1,72 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager, suppress
+
 import joblib
 import numpy as np
 import uvicorn
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
+
+# Coalesce concurrent predictions into a single model call
+class BatchScheduler:
+    def __init__(self, model, max_batch_size=64, max_wait=0.005):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.queue = asyncio.Queue()
+        self.task = None
+
+    def start(self):
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        self.task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self.task
+
+    # Queue the features and wait for the batch they end up in to be predicted
+    async def predict(self, features):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((features, future))
+        return await future
+
+    async def run(self):
+        while True:
+            # Wait for a first request, then give others a short window to join the batch
+            batch = [await self.queue.get()]
+            await asyncio.sleep(self.max_wait)
+            while len(batch) < self.max_batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            features = np.vstack([features for features, _ in batch])
+            try:
+                predictions = await run_in_threadpool(self.model.predict, features)
+            except Exception as error:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+
+            for (_, future), prediction in zip(batch, predictions):
+                if not future.done():
+                    future.set_result(prediction)
+
+
+# Load the trained model once at startup instead of at import time
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.model = joblib.load("data/model.pkl")
+    app.state.scheduler = BatchScheduler(app.state.model)
+    app.state.scheduler.start()
+    yield
+    await app.state.scheduler.stop()
+
+
 # Initialize the FastAPI app
-app = FastAPI()
-# Load the trained model
-model = joblib.load("data/model.pkl")
+app = FastAPI(lifespan=lifespan)
 
 
 # Define the request body structure
@@ -18,21 +77,46 @@ class PredictionRequest(BaseModel):
 
 # Define the predict endpoint
 @app.post("/predict")
-def predict(request: PredictionRequest):
+async def predict(request: PredictionRequest):
     # Extract the features from the request
     features = np.array([[request.article_text, request.title]])
 
-    # Make a prediction using the model
-    prediction = model.predict(features)
+    # Make a prediction as part of a batch of concurrent requests
+    prediction = await app.state.scheduler.predict(features)
 
     # Return the prediction as a JSON response
-    return {"Detailed_Sentiment": prediction[0]}
+    return {"Detailed_Sentiment": prediction}
+
+
+# Define the batch predict endpoint
+@app.post("/predict_batch")
+async def predict_batch(requests: list[PredictionRequest]):
+    if not requests:
+        return []
+
+    # Extract the features from the requests
+    features = np.array([[request.article_text, request.title] for request in requests])
+
+    # Make the predictions in the threadpool so the event loop keeps serving other requests
+    predictions = await run_in_threadpool(app.state.model.predict, features)
+
+    # Return the predictions as a JSON response
+    return [{"Detailed_Sentiment": prediction} for prediction in predictions]
 
 
 # Run the FastAPI app with Uvicorn
 
 if __name__ == "__main__":
-    # start the ASGI service
+    # start the ASGI service, the app is passed as an import string so it can run in several workers
     host = "127.0.0.1"
     port = 8000
-    uvicorn.run(app=app, host=host, port=port)
+    uvicorn.run(
+        "server:app",
+        host=host,
+        port=port,
+        workers=min(os.cpu_count() or 1, 4),
+        # "auto" picks uvloop where it is installed, it isn't available on Windows
+        loop="auto",
+        http="httptools",
+        log_level="warning",
+    )
@@ -6,27 +6,44 @@ Classes:
     ArticleAnalyzer: A class to perform various analyses on articles, including sentiment analysis,
     coherence calculation, key phrase extraction, and VA facilities identification.
 Functions:
-    get_pipeline(task, model_name, model_path):
-        Returns a pipeline for the specified task and model.
+    _get_pipeline(task, model_name, model_path, batch_size, quantize):
+        Returns a pipeline for the specified task and model, cached across analyzers.
+    _quantize_model(task, model_path, quantized_path):
+        Exports a model to ONNX and saves a dynamically int8 quantized copy of it.
+    _get_quantized_pipeline(task, quantized_path, batch_size):
+        Returns an ONNX Runtime pipeline for a quantized model.
+    compile_pipeline(pipe):
+        Compiles the PyTorch model of a pipeline with torch.compile and warms it up.
     initialize_models():
         Initializes the sentiment analysis, summarization, and key phrase extraction models.
-    __init__(db_path, model_path):
+    __init__(db_path, model_path, quantize, compile_models):
         Initializes the ArticleAnalyzer with the specified database and model paths.
+    run_batched(pipe, inputs, **kwargs):
+        Runs a pipeline over many inputs in length-sorted batches, returning outputs in input order.
     analyze_bias(text):
         Analyzes the bias of the given text, returning the average polarity and subjectivity scores.
+    analyze_bias_batch(texts):
+        Analyzes the bias of several texts at once, batching every chunk through the sentiment
+        model.
+    aggregate_bias(results):
+        Aggregates the sentiment model results for the chunks of a single text.
     calculate_coherence(text):
-        Calculates the coherence score of the given text based on cosine similarity of TF-IDF
-        vectors.
+        Calculates the coherence score of the given text based on cosine similarity of hashed
+        term frequency vectors.
     detailed_sentiment_analysis():
         Performs detailed sentiment analysis on articles from the database and returns the results.
     analyze_and_save_articles():
         Analyzes articles and saves the results to the database.
     extract_key_phrases(text):
         Extracts key phrases from the given text using a named entity recognition model.
+    extract_key_phrases_batch(texts):
+        Extracts key phrases from several texts in batches.
     identify_va_facilities(text):
         Identifies VA facilities mentioned in the given text.
     summarize_article(text):
         Summarizes the given text using a summarization model.
+    summarize_articles(texts):
+        Summarizes several texts in batches.
     get_article_analysis_topics_by_sentiment(sentiment):
         Retrieves article analysis topics by sentiment from the database.
     analyze_article(text):
@@ -34,11 +51,26 @@ Functions:
 """
 
 import os
+import tempfile
+from contextlib import closing
+from functools import lru_cache
+from pathlib import Path
+
+import ahocorasick
+import numpy as np
+import torch
+from numba import njit
+from optimum.onnxruntime import (
+    ORTModelForSeq2SeqLM,
+    ORTModelForSequenceClassification,
+    ORTModelForTokenClassification,
+    ORTQuantizer,
+)
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+from sklearn.feature_extraction.text import HashingVectorizer
+from transformers import AutoTokenizer, pipeline
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from transformers import pipeline
-
+from ..database.connection import get_connection
 from ..database.database_operations import (
     create_article_analysis_table,
     get_article_analysis_topics_by_sentiment,
@@ -47,6 +79,207 @@ from ..database.database_operations import (
 )
 from .sentiment_analysis import TopicExtractor
 
+# Stateless vectorizer shared by every coherence calculation, so no vocabulary is built per article
+_HASHER = HashingVectorizer(
+    n_features=2**18, alternate_sign=False, norm="l2", ngram_range=(1, 1)
+)
+
+
+def _build_automaton(phrases):
+    """
+    Build an Aho-Corasick automaton that finds all the given phrases in a single pass over a text.
+
+    Args:
+        phrases (iterable): The phrases to search for.
+
+    Returns:
+        ahocorasick.Automaton: The automaton, yielding the original phrase for every match.
+    """
+    automaton = ahocorasick.Automaton()
+    for phrase in phrases:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_lowercase_automaton(phrases):
+    """
+    Build an Aho-Corasick automaton that finds the given phrases case-insensitively in a
+    lowercased text.
+
+    Args:
+        phrases (iterable): The phrases to search for.
+
+    Returns:
+        ahocorasick.Automaton: The automaton, yielding the tuple of original phrases sharing the
+            lowercased form for every match.
+    """
+    phrases_by_lower = {}
+    for phrase in phrases:
+        phrases_by_lower.setdefault(phrase.lower(), []).append(phrase)
+    automaton = ahocorasick.Automaton()
+    for phrase_lower, originals in phrases_by_lower.items():
+        automaton.add_word(phrase_lower, tuple(originals))
+    automaton.make_automaton()
+    return automaton
+
+
+@njit(cache=True, fastmath=True)
+def _csr_self_sim_mean(indptr, indices, data, n):
+    """
+    Calculate the mean of X @ X.T for a CSR matrix X without building the product.
+
+    Args:
+        indptr (np.ndarray): The CSR row pointers of X.
+        indices (np.ndarray): The CSR column indices of X, sorted within each row.
+        data (np.ndarray): The CSR values of X.
+        n (int): The number of rows of X.
+
+    Returns:
+        float: The mean of all pairwise row dot products.
+    """
+    diagonal = 0.0
+    off_diagonal = 0.0
+    for i in range(n):
+        start_i = indptr[i]
+        end_i = indptr[i + 1]
+        for a in range(start_i, end_i):
+            diagonal += data[a] * data[a]
+
+        for j in range(i + 1, n):
+            # Intersect the sorted column indices of rows i and j
+            a = start_i
+            b = indptr[j]
+            end_j = indptr[j + 1]
+            while a < end_i and b < end_j:
+                if indices[a] == indices[b]:
+                    off_diagonal += data[a] * data[b]
+                    a += 1
+                    b += 1
+                elif indices[a] < indices[b]:
+                    a += 1
+                else:
+                    b += 1
+
+    # The product is symmetric, so every off-diagonal dot product appears twice
+    return (diagonal + 2.0 * off_diagonal) / (n * n)
+
+
+# The ONNX Runtime model class to use for each pipeline task
+_ORT_MODEL_CLASSES = {
+    "sentiment-analysis": ORTModelForSequenceClassification,
+    "summarization": ORTModelForSeq2SeqLM,
+    "ner": ORTModelForTokenClassification,
+}
+
+
+@lru_cache(maxsize=16)
+def _get_pipeline(task, model_name, model_path, batch_size, quantize=False):
+    """
+    Get or download the pipeline for a specific task and model.
+
+    Pipelines are cached, so every ArticleAnalyzer in the process shares the loaded models.
+    When quantization is enabled, a quantized copy of the model saved next to model_path (with
+    an '-int8' suffix) is used, and created from the full precision model if it doesn't exist
+    yet.
+
+    Args:
+        task (str): The task for the pipeline (e.g., 'sentiment-analysis').
+        model_name (str): The name of the model.
+        model_path (str): The path to save/load the model.
+        batch_size (int): The number of inputs fed to the model per forward pass.
+        quantize (bool, optional): Whether to quantize the model. Defaults to False.
+
+    Returns:
+        Pipeline: The loaded pipeline.
+    """
+    quantized_path = f"{model_path}-int8"
+    if quantize and os.path.isdir(quantized_path):
+        return _get_quantized_pipeline(task, quantized_path, batch_size)
+
+    try:
+        # Check if the model is available locally
+        pipe = pipeline(task, model=model_path, batch_size=batch_size)
+    except OSError:
+        # If not, download the model to the specified path
+        print(f"Downloading model {model_name} to {model_path}")
+        pipe = pipeline(task, model=model_name, batch_size=batch_size)
+        pipe.save_pretrained(model_path)
+
+    if quantize:
+        print(f"Quantizing model {model_name} to {quantized_path}")
+        _quantize_model(task, model_path, quantized_path)
+        return _get_quantized_pipeline(task, quantized_path, batch_size)
+
+    return pipe
+
+
+def _quantize_model(task, model_path, quantized_path):
+    """
+    Export a model to ONNX and save a dynamically int8 quantized copy of it.
+
+    Args:
+        task (str): The task the model is used for (e.g., 'sentiment-analysis').
+        model_path (str): The path of the full precision model.
+        quantized_path (str): The path to save the quantized model to.
+
+    Returns:
+        None
+    """
+    ort_model = _ORT_MODEL_CLASSES[task].from_pretrained(model_path, export=True)
+    quantization_config = AutoQuantizationConfig.avx512_vnni(
+        is_static=False, per_channel=False
+    )
+
+    # The quantized model is written to a staging directory next to quantized_path and moved
+    # into place once complete, so an interrupted export never leaves a partial model behind
+    staging_parent = os.path.dirname(os.path.abspath(quantized_path))
+    with (
+        tempfile.TemporaryDirectory() as onnx_path,
+        tempfile.TemporaryDirectory(dir=staging_parent) as staging_path,
+    ):
+        save_path = os.path.join(staging_path, os.path.basename(quantized_path))
+        ort_model.save_pretrained(onnx_path)
+        # Seq2seq models are exported as several ONNX files (encoder, decoder, ...)
+        for onnx_file in Path(onnx_path).glob("*.onnx"):
+            quantizer = ORTQuantizer.from_pretrained(
+                onnx_path, file_name=onnx_file.name
+            )
+            quantizer.quantize(
+                save_dir=save_path, quantization_config=quantization_config
+            )
+            # Keep the exported file names so the quantized model loads like the original
+            os.replace(
+                os.path.join(save_path, f"{onnx_file.stem}_quantized.onnx"),
+                os.path.join(save_path, onnx_file.name),
+            )
+
+        ort_model.config.save_pretrained(save_path)
+        if getattr(ort_model, "generation_config", None) is not None:
+            ort_model.generation_config.save_pretrained(save_path)
+        AutoTokenizer.from_pretrained(model_path).save_pretrained(save_path)
+
+        os.replace(save_path, quantized_path)
+
+
+def _get_quantized_pipeline(task, quantized_path, batch_size):
+    """
+    Load an ONNX Runtime pipeline for a quantized model.
+
+    Args:
+        task (str): The task for the pipeline (e.g., 'sentiment-analysis').
+        quantized_path (str): The path of the quantized model.
+        batch_size (int): The number of inputs fed to the model per forward pass.
+
+    Returns:
+        Pipeline: The loaded pipeline.
+    """
+    ort_model = _ORT_MODEL_CLASSES[task].from_pretrained(
+        quantized_path, provider="CPUExecutionProvider"
+    )
+    tokenizer = AutoTokenizer.from_pretrained(quantized_path)
+    return pipeline(task, model=ort_model, tokenizer=tokenizer, batch_size=batch_size)
+
 
 class ArticleAnalyzer:
     """ArticleAnalyzer class for analyzing news articles.
@@ -54,22 +287,34 @@ class ArticleAnalyzer:
         SENTIMENT_MODEL (str): The model name for sentiment analysis.
         SUMMARIZATION_MODEL (str): The model name for summarization.
         KEY_PHRASE_MODEL (str): The model name for key phrase extraction.
+        BATCH_SIZE (int): The number of inputs fed to a model per forward pass.
+        KEY_PHRASES (tuple): Key phrases to always look for when analyzing an article.
+        WARMUP_TEXT (str): A dummy text long enough to fill the model input, used to warm up
+            compiled models.
         model_path (str): The path to save/load models.
+        quantize (bool): Whether to run the models as int8 quantized ONNX models.
+        compile_models (bool): Whether to compile the PyTorch models with torch.compile.
         db_path (str): The path to the database.
         va_facilities (list): List of VA facilities to identify in the text.
-        max_length (int): Maximum input length for the model.
+        max_length (int): Maximum input length for the model, in tokens.
     Methods:
-        get_pipeline(task, model_name, model_path):
-            Get or download the pipeline for a specific task and model.
+        compile_pipeline(pipe):
+            Compile the PyTorch model of a pipeline with torch.compile and warm it up.
         initialize_models():
             Initialize the sentiment analysis, summarization, and key phrase extraction models.
-        __init__(db_path, model_path):
+        __init__(db_path, model_path, quantize, compile_models):
             Initialize the ArticleAnalyzer with database and model paths.
+        run_batched(pipe, inputs, **kwargs):
+            Run a pipeline over many inputs in length-sorted batches, in input order.
         analyze_bias(text):
             Analyze the bias of the given text and return average polarity and subjectivity.
+        analyze_bias_batch(texts):
+            Analyze the bias of several texts, batching every chunk through the sentiment model.
+        aggregate_bias(results):
+            Aggregate the sentiment model results for the chunks of a single text.
         calculate_coherence(text):
-            Calculate the coherence score of the given text based on cosine similarity of TF-IDF
-            vectors.
+            Calculate the coherence score of the given text based on cosine similarity of hashed
+            term frequency vectors.
         detailed_sentiment_analysis():
             Perform detailed sentiment analysis on articles from the database and return the
             results.
@@ -77,10 +322,14 @@ class ArticleAnalyzer:
             Analyze articles and save the results to the database.
         extract_key_phrases(text):
             Extract key phrases from the given text using the key phrase extraction model.
+        extract_key_phrases_batch(texts):
+            Extract key phrases from several texts in batches.
         identify_va_facilities(text):
             Identify VA facilities mentioned in the given text.
         summarize_article(text):
             Summarize the given text using the summarization model.
+        summarize_articles(texts):
+            Summarize several texts in batches.
         get_article_analysis_topics_by_sentiment(sentiment):
             Get article analysis topics filtered by sentiment from the database.
         analyze_article(text):
@@ -91,27 +340,52 @@ class ArticleAnalyzer:
     SENTIMENT_MODEL = "siebert/sentiment-roberta-large-english"
     SUMMARIZATION_MODEL = "facebook/bart-large-cnn"
     KEY_PHRASE_MODEL = "dbmdz/bert-large-cased-finetuned-conll03-english"
-
-    def get_pipeline(self, task, model_name, model_path):
+    BATCH_SIZE = 32
+    KEY_PHRASES = (
+        "PACT",
+        "MISSION Act",
+        "burn pit",
+        "toxic exposure",
+        "mental health",
+        "PTSD",
+        "Veteran suicide",
+        "military sexual trauma",
+        "Disability benefits",
+        "healthcare access",
+        "Community Care",
+    )
+    WARMUP_TEXT = "warm up " * 256
+
+    def compile_pipeline(self, pipe):
         """
-        Get or download the pipeline for a specific task and model.
+        Compile the PyTorch model of a pipeline with torch.compile and warm it up.
+
+        The model is run once on the tokenized WARMUP_TEXT so the first real call doesn't pay the
+        compile cost. The model is called directly rather than through the pipeline, since not
+        every pipeline task accepts truncation. If compiling fails, or the model isn't a PyTorch
+        model (e.g. a quantized ONNX model), the pipeline keeps its original model.
 
         Args:
-            task (str): The task for the pipeline (e.g., 'sentiment-analysis').
-            model_name (str): The name of the model.
-            model_path (str): The path to save/load the model.
+            pipe (Pipeline): The pipeline whose model to compile.
 
         Returns:
-            Pipeline: The loaded pipeline.
+            Pipeline: The pipeline.
         """
+        model = pipe.model
+        # Pipelines are shared between analyzers, so the model may already be compiled
+        if not isinstance(model, torch.nn.Module) or hasattr(model, "_orig_mod"):
+            return pipe
+
+        inputs = pipe.tokenizer(
+            self.WARMUP_TEXT, truncation=True, return_tensors="pt"
+        ).to(model.device)
         try:
-            # Check if the model is available locally
-            pipe = pipeline(task, model=model_path)
-        except OSError:
-            # If not, download the model to the specified path
-            print(f"Downloading model {model_name} to {model_path}")
-            pipe = pipeline(task, model=model_name)
-            pipe.save_pretrained(model_path)
+            pipe.model = torch.compile(model, mode="reduce-overhead", fullgraph=False)
+            with torch.inference_mode():
+                pipe.model(**inputs)
+        except Exception as e:
+            print(f"Error compiling {type(model).__name__}, using it uncompiled: {e}")
+            pipe.model = model
 
         return pipe
 
@@ -126,26 +400,49 @@ class ArticleAnalyzer:
         summarization_model_path = os.path.join(self.model_path, "facebook")
         key_phrase_model_path = os.path.join(self.model_path, "dbmdz")
 
-        self.sentiment_analyzer = self.get_pipeline(
-            "sentiment-analysis", self.SENTIMENT_MODEL, sentiment_model_path
+        self.sentiment_analyzer = _get_pipeline(
+            "sentiment-analysis",
+            self.SENTIMENT_MODEL,
+            sentiment_model_path,
+            self.BATCH_SIZE,
+            self.quantize,
         )
-        self.summarizer = self.get_pipeline(
-            "summarization", self.SUMMARIZATION_MODEL, summarization_model_path
+        self.summarizer = _get_pipeline(
+            "summarization",
+            self.SUMMARIZATION_MODEL,
+            summarization_model_path,
+            self.BATCH_SIZE,
+            self.quantize,
         )
 
-        self.key_phrase_extractor = self.get_pipeline(
-            "ner", self.KEY_PHRASE_MODEL, key_phrase_model_path
+        self.key_phrase_extractor = _get_pipeline(
+            "ner",
+            self.KEY_PHRASE_MODEL,
+            key_phrase_model_path,
+            self.BATCH_SIZE,
+            self.quantize,
         )
 
-    def __init__(self, db_path, model_path):
+        if self.compile_models:
+            self.compile_pipeline(self.sentiment_analyzer)
+            self.compile_pipeline(self.summarizer)
+            self.compile_pipeline(self.key_phrase_extractor)
+
+    def __init__(self, db_path, model_path, quantize=False, compile_models=False):
         """
         Initialize the ArticleAnalyzer with database and model paths.
 
         Args:
             db_path (str): The path to the database.
             model_path (str): The path to save/load models.
+            quantize (bool, optional): Whether to run the models as int8 quantized ONNX models.
+                Defaults to False.
+            compile_models (bool, optional): Whether to compile the PyTorch models with
+                torch.compile. Defaults to False.
         """
         self.model_path = model_path
+        self.quantize = quantize
+        self.compile_models = compile_models
         self.initialize_models()
         self.db_path = db_path
         self.va_facilities = [
@@ -154,7 +451,37 @@ class ArticleAnalyzer:
             "Veterans Affairs",
             "VA Clinic",
         ]  # Add more as needed
-        self.max_length = 512  # Maximum input length for the model
+        self.max_length = 512  # Maximum input length for the model, in tokens
+        self._facility_automaton = _build_automaton(self.va_facilities)
+        self._key_phrase_automaton = _build_lowercase_automaton(self.KEY_PHRASES)
+
+    def run_batched(self, pipe, inputs, **kwargs):
+        """
+        Run a pipeline over many inputs in batches and return the outputs in input order.
+
+        The inputs are sorted by length before batching so that each batch is padded to a
+        similar length, which keeps the model from spending most of its time on padding.
+
+        Args:
+            pipe (Pipeline): The pipeline to run.
+            inputs (list): The texts to feed through the pipeline.
+            **kwargs: Extra keyword arguments passed to the pipeline call.
+
+        Returns:
+            list: The pipeline output for each input, in the same order as `inputs`.
+        """
+        if not inputs:
+            return []
+
+        order = sorted(range(len(inputs)), key=lambda index: len(inputs[index]))
+        outputs = pipe(
+            [inputs[index] for index in order], batch_size=self.BATCH_SIZE, **kwargs
+        )
+
+        results = [None] * len(inputs)
+        for index, output in zip(order, outputs):
+            results[index] = output
+        return results
 
     def analyze_bias(self, text):
         """
@@ -166,34 +493,78 @@ class ArticleAnalyzer:
         Returns:
             tuple: A tuple containing average polarity and subjectivity scores.
         """
-        # Split the text into chunks of max_length
-        chunks = [
-            text[i : i + self.max_length] for i in range(0, len(text), self.max_length)
-        ]
-        polarity_scores = []
-        subjectivity_scores = []
-
-        for chunk in chunks:
-            result = self.sentiment_analyzer(chunk)[0]
-            sentiment = result["label"]
-            score = result["score"]
-            polarity = score if sentiment == "POSITIVE" else -score
-            # Normalize polarity to avoid extreme values
-            polarity = max(min(polarity, 0.5), -0.5)
-            subjectivity = 1 - score  # Simplified assumption
-            polarity_scores.append(polarity)
-            subjectivity_scores.append(subjectivity)
+        return self.analyze_bias_batch([text])[0]
+
+    def analyze_bias_batch(self, texts):
+        """
+        Analyze the bias of several texts and return average polarity and subjectivity for each.
+
+        Every text is split into windows of tokens that fill the model input (max_length
+        including the special tokens), and the windows of all texts are fed through the
+        sentiment model together, then regrouped per text.
+
+        Args:
+            texts (list): The texts to analyze.
+
+        Returns:
+            list: A list of (average polarity, average subjectivity) tuples, one per text.
+        """
+        tokenizer = self.sentiment_analyzer.tokenizer
+        window = self.max_length - tokenizer.num_special_tokens_to_add()
+        token_ids = []
+        if texts:
+            token_ids = tokenizer(list(texts), add_special_tokens=False)["input_ids"]
+
+        owners = []
+        chunks = []
+        for index, ids in enumerate(token_ids):
+            # Split the tokens into windows that fill the model input
+            for i in range(0, len(ids), window):
+                owners.append(index)
+                chunks.append(tokenizer.decode(ids[i : i + window]))
+
+        results = [[] for _ in texts]
+        outputs = self.run_batched(
+            self.sentiment_analyzer,
+            chunks,
+            truncation=True,
+            max_length=self.max_length,
+        )
+        for index, output in zip(owners, outputs):
+            results[index].append(output)
+
+        return [self.aggregate_bias(result) for result in results]
+
+    @staticmethod
+    def aggregate_bias(results):
+        """
+        Aggregate the sentiment model results for the chunks of a single text.
+
+        Args:
+            results (list): The sentiment model results, each with a 'label' and a 'score'.
+
+        Returns:
+            tuple: A tuple containing average polarity and subjectivity scores.
+        """
+        if not results:
+            return 0.0, 0.0
+
+        labels = np.array([result["label"] for result in results])
+        scores = np.array([result["score"] for result in results])
+        # Normalize polarity to avoid extreme values
+        polarity_scores = np.clip(
+            np.where(labels == "POSITIVE", scores, -scores), -0.5, 0.5
+        )
+        subjectivity_scores = 1.0 - scores  # Simplified assumption
 
         # Aggregate the results
-        avg_polarity = sum(polarity_scores) / len(polarity_scores)
-        avg_subjectivity = sum(subjectivity_scores) / len(subjectivity_scores)
-        return avg_polarity, avg_subjectivity
+        return float(polarity_scores.mean()), float(subjectivity_scores.mean())
 
     def calculate_coherence(self, text):
         """
         Calculate the coherence score of a given text.
         The coherence score is calculated based on the cosine similarity
-        between the TF-IDF vectors of the sentences in the text.
+        between the hashed term frequency vectors of the sentences in the text.
         Args:
             text (str): The input text to calculate coherence for.
         Returns:
@@ -204,24 +575,29 @@ class ArticleAnalyzer:
         if len(sentences) < 2:
             return 1.0  # Single sentence, coherence is perfect
 
-        vectorizer = TfidfVectorizer().fit_transform(sentences)
-        vectors = vectorizer.toarray()
-        cosine_matrix = cosine_similarity(vectors)
-        coherence_score = cosine_matrix.mean()
+        # Rows are L2-normalized, so their dot products are the cosine similarities
+        vectors = _HASHER.transform(sentences)
+        vectors.sort_indices()
+        coherence_score = _csr_self_sim_mean(
+            vectors.indptr, vectors.indices, vectors.data, vectors.shape[0]
+        )
         return coherence_score
 
-    def detailed_sentiment_analysis(self):
+    def detailed_sentiment_analysis(self, conn=None):
         """
         Perform detailed sentiment analysis on articles from the database and return the results.
 
+        Args:
+            conn (Connection, optional): An open connection to read the articles with.
+
         Returns:
             list: A list of tuples containing detailed sentiment analysis results.
         """
-        articles = get_articles(self.db_path)
+        articles = get_articles(self.db_path, conn=conn)
+        biases = self.analyze_bias_batch([text for _, text in articles])
         detailed_results = []
-        for title, text in articles:
+        for (title, text), (polarity, subjectivity) in zip(articles, biases):
             topics = ""
-            polarity, subjectivity = self.analyze_bias(text)
             coherence = self.calculate_coherence(text)
             if polarity > 0:
                 sentiment = "positive"
@@ -237,16 +613,31 @@ class ArticleAnalyzer:
             )
         return detailed_results
 
-    def analyze_and_save_articles(self):
+    def analyze_and_save_articles(self, conn=None):
         """
         Analyze articles and save the results to the database.
+        The articles are read and the results written over a single connection, with the table
+        creation and the inserts committed as one transaction.
+
+        Args:
+            conn (Connection, optional): An open connection to use. When omitted, one is opened
+                for db_path and closed afterwards.
 
         Returns:
             None
         """
-        results = self.detailed_sentiment_analysis()
-        create_article_analysis_table(self.db_path)
-        insert_article_analysis(self.db_path, results)
+        if conn is None:
+            with closing(get_connection(self.db_path)) as conn:
+                self.analyze_and_save_articles(conn)
+            return
+
+        results = self.detailed_sentiment_analysis(conn)
+        with conn:
+            # sqlite3 doesn't open a transaction before DDL, so begin one explicitly to commit
+            # the table creation together with the inserts
+            conn.execute("BEGIN IMMEDIATE")
+            create_article_analysis_table(self.db_path, conn=conn)
+            insert_article_analysis(self.db_path, results, conn=conn)
 
     def extract_key_phrases(self, text):
         """
@@ -258,8 +649,20 @@ class ArticleAnalyzer:
         Returns:
             list: A list of extracted key phrases.
         """
-        key_phrases = self.key_phrase_extractor(text)
-        return [phrase["word"] for phrase in key_phrases]
+        return self.extract_key_phrases_batch([text])[0]
+
+    def extract_key_phrases_batch(self, texts):
+        """
+        Extract key phrases from several texts using the key phrase extraction model.
+
+        Args:
+            texts (list): The texts to analyze.
+
+        Returns:
+            list: A list of extracted key phrases for each text.
+        """
+        outputs = self.run_batched(self.key_phrase_extractor, texts)
+        return [[phrase["word"] for phrase in key_phrases] for key_phrases in outputs]
 
     def identify_va_facilities(self, text):
         """
@@ -271,7 +674,8 @@ class ArticleAnalyzer:
         Returns:
             list: A list of identified VA facilities.
         """
-        facilities = [facility for facility in self.va_facilities if facility in text]
+        found = {facility for _, facility in self._facility_automaton.iter(text)}
+        facilities = [facility for facility in self.va_facilities if facility in found]
         return facilities
 
     def summarize_article(self, text):
@@ -284,8 +688,27 @@ class ArticleAnalyzer:
         Returns:
             str: The summary of the text.
         """
-        summary = self.summarizer(text, max_length=150, min_length=30, do_sample=False)
-        return summary[0]["summary_text"]
+        return self.summarize_articles([text])[0]
+
+    def summarize_articles(self, texts):
+        """
+        Summarize several texts using the summarization model.
+
+        Args:
+            texts (list): The texts to summarize.
+
+        Returns:
+            list: The summary of each text.
+        """
+        outputs = self.run_batched(
+            self.summarizer,
+            texts,
+            max_length=150,
+            min_length=30,
+            do_sample=False,
+            truncation=True,
+        )
+        return [summary["summary_text"] for summary in outputs]
 
     def get_article_analysis_topics_by_sentiment(self, sentiment):
         """
@@ -310,29 +733,23 @@ class ArticleAnalyzer:
         Returns:
             dict: A dictionary containing the analysis results.
         """
-        key_phrases = [
-            "PACT",
-            "MISSION Act",
-            "burn pit",
-            "toxic exposure",
-            "mental health",
-            "PTSD",
-            "Veteran suicide",
-            "military sexual trauma",
-            "Disability benefits",
-            "healthcare access",
-            "Community Care",
-        ]
         summary = self.summarize_article(text)
         extracted_key_phrases = self.extract_key_phrases(text)
         va_facilities = self.identify_va_facilities(text)
-        combined_key_phrases = set(extracted_key_phrases + key_phrases)
-        key_phrases_discussed = [
-            phrase for phrase in combined_key_phrases if phrase.lower() in text.lower()
-        ]
+        text_lower = text.lower()
+        key_phrases_discussed = {
+            phrase
+            for _, phrases in self._key_phrase_automaton.iter(text_lower)
+            for phrase in phrases
+        }
+        # The few phrases extracted from this article are looked for directly rather than
+        # building an automaton for every article
+        key_phrases_discussed.update(
+            phrase for phrase in extracted_key_phrases if phrase.lower() in text_lower
+        )
         return {
             "summary": summary,
             "key_phrases": extracted_key_phrases,
             "va_facilities": va_facilities,
-            "key_phrases_discussed": key_phrases_discussed,
+            "key_phrases_discussed": list(key_phrases_discussed),
         }
@@ -1,13 +1,31 @@
 """
 Module: entity_extraction
-This module provides a function to extract named entities from text using spaCy.
+This module provides functions to extract named entities from text using spaCy.
 Functions:
     extract_entities(text): Extracts named entities from the given text.
+    extract_entities_batch(texts, n_process): Extracts named entities from several texts in
+        batches.
 """
 
+from functools import lru_cache
+
 import spacy
 
-nlp = spacy.load("en_core_web_lg")
+# Batches with fewer characters than this are processed in the current process, since every
+# worker process reloads the spaCy model
+MIN_CHARS_PER_PROCESS_POOL = 1_000_000
+
+
+@lru_cache(maxsize=1)
+def _get_nlp():
+    """
+    Loads the spaCy model on first use, so importing this module doesn't load it.
+
+    Returns:
+        Language: The loaded spaCy pipeline.
+    """
+    # Only the named entity recognizer is used, so skip the other pipeline components
+    return spacy.load("en_core_web_lg", disable=["parser", "lemmatizer", "tagger"])
 
 
 def extract_entities(text):
@@ -20,6 +38,30 @@ def extract_entities(text):
     Returns:
         list: A list of tuples containing entity text and label.
     """
-    doc = nlp(text)
+    doc = _get_nlp()(text)
     entities = [(entity.text, entity.label_) for entity in doc.ents]
     return entities
+
+
+def extract_entities_batch(texts, n_process=None):
+    """
+    Extracts named entities from several texts, processing them in batches.
+
+    Args:
+        texts (list): The texts to analyze.
+        n_process (int, optional): The number of processes to run spaCy in, -1 for all CPUs.
+            Defaults to all CPUs for batches of at least MIN_CHARS_PER_PROCESS_POOL characters
+            in total, and to a single process otherwise.
+
+    Returns:
+        list: A list of (entity text, label) tuples for each text.
+    """
+    texts = list(texts)
+    if n_process is None:
+        total_chars = sum(map(len, texts))
+        n_process = -1 if total_chars >= MIN_CHARS_PER_PROCESS_POOL else 1
+
+    return [
+        [(entity.text, entity.label_) for entity in doc.ents]
+        for doc in _get_nlp().pipe(texts, batch_size=64, n_process=n_process)
+    ]
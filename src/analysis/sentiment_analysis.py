@@ -6,6 +6,8 @@ Classes:
     TopicExtractor: A class to extract topics from text based on sentiment analysis.
 """
 
+import math
+
 import nltk
 from nltk.sentiment.vader import SentimentIntensityAnalyzer
 from nltk.tokenize import word_tokenize
@@ -14,6 +16,17 @@ from nltk.tokenize import word_tokenize
 nltk.download("stopwords")
 nltk.download("vader_lexicon")
 
+# Shared analyzer, so the VADER lexicon is loaded once rather than once per article
+_SIA = SentimentIntensityAnalyzer()
+
+# The compound score of a single word is its lexicon valence normalized with VADER's alpha of 15,
+# so the words scoring a compound of -0.5 or lower can be looked up ahead of time
+_NEGATIVE_WORDS = frozenset(
+    word
+    for word, valence in _SIA.lexicon.items()
+    if valence / math.sqrt(valence * valence + 15) <= -0.5
+)
+
 
 class TopicExtractor:
     """
@@ -33,7 +46,7 @@ class TopicExtractor:
             text (str): The text to analyze.
         """
         self.text = text
-        self.sentiment_analyzer = SentimentIntensityAnalyzer()
+        self.sentiment_analyzer = _SIA
         self.negative_words = None
 
     def identify_negative_words(self):
@@ -44,11 +57,7 @@ class TopicExtractor:
             list: A list of negative words.
         """
         words = word_tokenize(self.text)
-        negative_words = [
-            word
-            for word in words
-            if self.sentiment_analyzer.polarity_scores(word)["compound"] <= -0.5
-        ]
+        negative_words = [word for word in words if word.lower() in _NEGATIVE_WORDS]
         self.negative_words = negative_words
         return self.negative_words
 
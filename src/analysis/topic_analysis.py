@@ -12,27 +12,48 @@ Functions:
 
 import csv
 import os
-import sqlite3
-from collections import Counter
+from collections import Counter, defaultdict
+from itertools import chain, islice
 
 import nltk
+from joblib import Parallel, delayed
 from nltk import pos_tag
 from nltk.tokenize import word_tokenize
 
-# Ensure necessary NLTK data is downloaded
-nltk.download("averaged_perceptron_tagger")
+from ..database.database_operations import iterate_article_topics_by_sentiment
+
+# Ensure necessary NLTK data is downloaded, checking for it first since every worker process
+# of analyze_topics imports this module
+try:
+    nltk.data.find("taggers/averaged_perceptron_tagger")
+except LookupError:
+    nltk.download("averaged_perceptron_tagger")
 
 # Define excluded topics
-EXCLUDED_TOPICS = {
-    "donald",
-    "trump",
-    "defense",
-    "department",
-    "va",
-    "vas",
-    "affairs",
-    "veteran",
-}
+EXCLUDED_TOPICS = frozenset(
+    {
+        "donald",
+        "trump",
+        "defense",
+        "department",
+        "va",
+        "vas",
+        "affairs",
+        "veteran",
+    }
+)
+
+# Define relevant parts of speech
+_RELEVANT_POS = frozenset(
+    {
+        "NN",  # Nouns
+        "VB",  # Verbs
+        "RB",  # Adverbs
+    }
+)
+
+# Number of articles tokenized and tagged together by a single worker
+_ARTICLES_PER_CHUNK = 256
 
 
 def collect_negative_articles(db_path):
@@ -43,52 +64,72 @@ def collect_negative_articles(db_path):
         db_path (str): The path to the database.
 
     Returns:
-        list: A list of tuples containing article titles and topics.
+        Iterator: An iterator over tuples containing article titles and topics.
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    query = "SELECT title, topics FROM article_analysis WHERE sentiment = 'negative'"
-    cursor.execute(query)
-    articles = cursor.fetchall()
-    conn.close()
-    return articles
+    return iterate_article_topics_by_sentiment(db_path, "negative")
 
 
-def analyze_topics(articles):
+def _tokenize_and_tag(topics):
     """
-    Analyzes topics from the collected articles.
+    Tokenizes and POS tags a string of topics and counts the relevant words.
 
     Args:
-        articles (list): A list of tuples containing article titles and topics.
+        topics (str): The topics of one or more articles, joined by spaces.
 
     Returns:
         Counter: A counter object with word counts of relevant topics.
     """
-    ## Join topics from articles and tokenize
-    all_topics = " ".join(topics for _, topics in articles)
     filtered_words = [
-        word
-        for word in word_tokenize(all_topics)
-        if word.lower() not in EXCLUDED_TOPICS
+        word for word in word_tokenize(topics) if word.lower() not in EXCLUDED_TOPICS
     ]
 
-    # Apply POS tagging
-    pos_tags = pos_tag(filtered_words)
+    # Apply POS tagging and count the relevant nouns, verbs, and adverbs
+    return Counter(
+        word for word, pos in pos_tag(filtered_words) if pos in _RELEVANT_POS
+    )
 
-    # Define relevant parts of speech
-    relevant_pos = [
-        "NN",  # Nouns
-        "VB",  # Verbs
-        "RB",  # Adverbs
-    ]
 
-    # Filter for relevant nouns, verbs, and adjectives
-    verbs_and_nouns = [word for word, pos in pos_tags if pos in relevant_pos]
+def _iterate_topic_chunks(articles):
+    """
+    Groups the topics of the articles into strings of _ARTICLES_PER_CHUNK articles each.
 
-    # Count occurrences of each word
-    word_counts = Counter(verbs_and_nouns)
+    Args:
+        articles (iterable): An iterable of tuples containing article titles and topics.
 
-    return word_counts
+    Yields:
+        str: The topics of the next chunk of articles, joined by spaces.
+    """
+    articles = iter(articles)
+    while chunk := list(islice(articles, _ARTICLES_PER_CHUNK)):
+        yield " ".join(topics for _, topics in chunk)
+
+
+def analyze_topics(articles):
+    """
+    Analyzes topics from the collected articles.
+
+    The articles are split into chunks that are tokenized and POS tagged in parallel, and the
+    per-chunk counts are merged.
+
+    Args:
+        articles (iterable): An iterable of tuples containing article titles and topics.
+
+    Returns:
+        Counter: A counter object with word counts of relevant topics.
+    """
+    chunks = _iterate_topic_chunks(articles)
+    first_chunk = next(chunks, "")
+    second_chunk = next(chunks, None)
+
+    # Not worth starting worker processes for a single chunk
+    if second_chunk is None:
+        return _tokenize_and_tag(first_chunk)
+
+    partial_counts = Parallel(n_jobs=-1, backend="loky")(
+        delayed(_tokenize_and_tag)(chunk)
+        for chunk in chain((first_chunk, second_chunk), chunks)
+    )
+    return sum(partial_counts, Counter())
 
 
 def export_top_topics_to_csv(
@@ -110,11 +151,16 @@ def export_top_topics_to_csv(
     # join the file path
     filepath = os.path.join(data_folder, filename)
     top_words = word_counts.most_common(top_n)
-    top_titles_and_topics = {word: set() for word, _ in top_words}
-    for word, _ in top_words:
-        for title, topics in articles:
-            if word in topics:
-                top_titles_and_topics[word].add(title)
+
+    # Index the titles by each of their topics once, instead of scanning every article per word
+    titles_by_topic = defaultdict(set)
+    for title, topics in articles:
+        for topic in set(topics.lower().split(", ")):
+            titles_by_topic[topic].add(title)
+
+    top_titles_and_topics = {
+        word: titles_by_topic.get(word.lower(), set()) for word, _ in top_words
+    }
 
     with open(filepath, mode="w", newline="", encoding="utf-8") as csv_file:
         writer = csv.writer(csv_file)
@@ -132,7 +178,8 @@ def main():
     """
     data_folder = "data"
     db_path = "data/articles.sqlite"
-    articles = collect_negative_articles(db_path)
+    # The articles are read twice, for counting and for the export
+    articles = list(collect_negative_articles(db_path))
     word_counts = analyze_topics(articles)
     export_top_topics_to_csv(
         word_counts, articles, data_folder=data_folder, filename="top_topics.csv"
@@ -2,24 +2,30 @@
 Module: topic_modeling
 This module provides functions for topic modeling using LDA, including tokenization,
 dictionary creation, bag-of-words corpus creation, and coherence score calculation.
+The LDA model is trained once on a corpus of tokenized documents rather than once per document.
 Functions:
     tokenize_text(article_text): Tokenizes the input text into words.
-    create_dictionary(tokenized_text): Creates a dictionary representation of the tokenized text.
-    create_bow_corpus(dictionary, tokenized_text): Converts tokenized text into a bag-of-words (BoW)
-        corpus.
+    create_dictionary(tokenized_docs): Creates a dictionary representation of the tokenized
+        documents.
+    create_bow_corpus(dictionary, tokenized_docs): Converts tokenized documents into a
+        bag-of-words (BoW) corpus.
     perform_topic_modeling(bow_corpus, dictionary): Performs topic modeling using LDA.
-    calculate_coherence_scores(tokenized_text, dictionary, lda_model): Calculates coherence scores
+    calculate_coherence_scores(tokenized_docs, dictionary, lda_model): Calculates coherence scores
         for the LDA model.
     extract_entities_from_text(tokenized_text): Extracts entities from the tokenized text.
-    perform_lda(tokenized_text): Performs LDA topic modeling on the tokenized text.
+    perform_lda(tokenized_docs): Performs LDA topic modeling on the tokenized documents.
+    get_document_topics(lda_model, dictionary, tokenized_doc): Gets the topic distribution of a
+        single document.
     print_topics(lda_model, num_words): Prints the topics from the LDA model.
 """
 
+import os
+
 from gensim import corpora, models
 from gensim.models.coherencemodel import CoherenceModel
 from nltk.tokenize import word_tokenize
 
-from .entity_extraction import extract_entities
+from .entity_extraction import extract_entities_batch
 
 
 def tokenize_text(article_text):
@@ -35,31 +41,41 @@ def tokenize_text(article_text):
     return word_tokenize(article_text)
 
 
-def create_dictionary(tokenized_text):
+def _lda_workers():
+    """
+    Returns the number of worker processes to train LDA with, leaving one CPU for the master.
+
+    Returns:
+        int: The number of workers.
+    """
+    return max((os.cpu_count() or 1) - 1, 1)
+
+
+def create_dictionary(tokenized_docs):
     """
-    Creates a dictionary representation of the tokenized text.
+    Creates a dictionary representation of the tokenized documents.
 
     Args:
-        tokenized_text (list): A list of tokenized words.
+        tokenized_docs (list): A list of documents, each a list of tokenized words.
 
     Returns:
         Dictionary: A Gensim dictionary object.
     """
-    return corpora.Dictionary([tokenized_text])
+    return corpora.Dictionary(tokenized_docs)
 
 
-def create_bow_corpus(dictionary, tokenized_text):
+def create_bow_corpus(dictionary, tokenized_docs):
     """
-    Converts tokenized text into a bag-of-words (BoW) corpus.
+    Converts tokenized documents into a bag-of-words (BoW) corpus.
 
     Args:
         dictionary (Dictionary): A Gensim dictionary object.
-        tokenized_text (list): A list of tokenized words.
+        tokenized_docs (list): A list of documents, each a list of tokenized words.
 
     Returns:
-        list: A list of BoW representations.
+        list: A list of BoW representations, one per document.
     """
-    return [dictionary.doc2bow(tokenized_text)]
+    return [dictionary.doc2bow(tokenized_doc) for tokenized_doc in tokenized_docs]
 
 
 def perform_topic_modeling(bow_corpus, dictionary):
@@ -67,24 +83,30 @@ def perform_topic_modeling(bow_corpus, dictionary):
     Performs topic modeling using LDA.
 
     Args:
-        bow_corpus (list): A list of BoW representations.
+        bow_corpus (list): A list of BoW representations, one per document.
         dictionary (Dictionary): A Gensim dictionary object.
 
     Returns:
         tuple: A tuple containing the LDA model and a string of topics.
     """
-    lda_model = models.LdaModel(bow_corpus, num_topics=5, id2word=dictionary, passes=15)
+    lda_model = models.LdaMulticore(
+        bow_corpus,
+        num_topics=5,
+        id2word=dictionary,
+        passes=15,
+        workers=_lda_workers(),
+    )
     topics_list = lda_model.print_topics(num_words=4)
     topics = ", ".join([topic[1] for topic in topics_list])
     return lda_model, topics
 
 
-def calculate_coherence_scores(tokenized_text, dictionary, lda_model):
+def calculate_coherence_scores(tokenized_docs, dictionary, lda_model):
     """
     Calculates coherence scores for the LDA model.
 
     Args:
-        tokenized_text (list): A list of tokenized words.
+        tokenized_docs (list): A list of documents, each a list of tokenized words.
         dictionary (Dictionary): A Gensim dictionary object.
         lda_model (LdaModel): A trained LDA model.
 
@@ -95,7 +117,7 @@ def calculate_coherence_scores(tokenized_text, dictionary, lda_model):
     for coherence_type in ["c_v", "u_mass", "c_uci", "c_npmi"]:
         coherence_model_lda = CoherenceModel(
             model=lda_model,
-            texts=[tokenized_text],
+            texts=tokenized_docs,
             dictionary=dictionary,
             coherence=coherence_type,
         )
@@ -114,7 +136,8 @@ def extract_entities_from_text(tokenized_text):
     Returns:
         str: A string of extracted entities.
     """
-    entities_list = [extract_entities(text) for text in tokenized_text]
+    # The tokens all come from one document, too little text to start worker processes for
+    entities_list = extract_entities_batch(tokenized_text, n_process=1)
     flattened_entities_list = [
         entity for sublist in entities_list for entity in sublist
     ]
@@ -122,20 +145,36 @@ def extract_entities_from_text(tokenized_text):
     return entities
 
 
-def perform_lda(tokenized_text):
+def perform_lda(tokenized_docs):
     """
-    Performs LDA topic modeling on the tokenized text.
+    Performs LDA topic modeling on the tokenized documents, training a single model for the
+    whole corpus.
 
     Args:
-        tokenized_text (list): A list of tokenized words.
+        tokenized_docs (list): A list of documents, each a list of tokenized words.
+
+    Returns:
+        tuple: A tuple containing the trained LDA model and its dictionary.
+    """
+    dictionary = create_dictionary(tokenized_docs)
+    bow_corpus = create_bow_corpus(dictionary, tokenized_docs)
+    lda_model, _ = perform_topic_modeling(bow_corpus, dictionary)
+    return lda_model, dictionary
+
+
+def get_document_topics(lda_model, dictionary, tokenized_doc):
+    """
+    Gets the topic distribution of a single document from a trained LDA model.
+
+    Args:
+        lda_model (LdaModel): A trained LDA model.
+        dictionary (Dictionary): The Gensim dictionary the model was trained with.
+        tokenized_doc (list): A list of tokenized words.
 
     Returns:
-        LdaModel: A trained LDA model.
+        list: A list of (topic id, probability) tuples.
     """
-    dictionary = corpora.Dictionary([tokenized_text])
-    bow_corpus = [dictionary.doc2bow(tokenized_text)]
-    lda_model = models.LdaModel(bow_corpus, num_topics=5, id2word=dictionary, passes=15)
-    return lda_model
+    return lda_model.get_document_topics(dictionary.doc2bow(tokenized_doc))
 
 
 def print_topics(lda_model, num_words=4):
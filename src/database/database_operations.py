@@ -3,34 +3,96 @@ This module provides various database operations for managing and interacting wi
 database. It includes functions to execute queries, save data, create tables, and retrieve data from
 the database.
 Functions:
+    close_all():
     execute_query_with_management(
-        db_path: str, query: str, params: tuple = (), fetch: bool = False
+        db_path: str, query: str, params: tuple = (), fetch: bool = False, conn: Connection = None
     ):
+    iterate_query_results(db_path: str, query: str, params: tuple = (), conn: Connection = None):
+    execute_many_in_transaction(db_path: str, statements: list, conn: Connection = None):
     save_to_sqlite(
-        df: pd.DataFrame, db_path: str, table_name: str, if_exists: str = "append"
+        df: pd.DataFrame,
+        db_path: str,
+        table_name: str,
+        if_exists: str = "append",
+        conn: Connection = None,
     ) -> None:
-    save_topics_to_db(db_path: str, sentiment: str, topics: str):
-    create_article_analysis_table(db_path: str):
-    insert_article_analysis(db_path: str, results: list):
-    get_article_analysis_topics_by_sentiment(db_path: str, sentiment):
-    get_articles(db_path: str):
+    save_topics_to_db(db_path: str, sentiment: str, topics: str, conn: Connection = None):
+    create_article_analysis_table(db_path: str, conn: Connection = None):
+    insert_article_analysis(db_path: str, results: list, conn: Connection = None):
+    get_article_analysis_topics_by_sentiment(db_path: str, sentiment, conn: Connection = None):
+    iterate_article_topics_by_sentiment(db_path: str, sentiment, conn: Connection = None):
+    get_articles(db_path: str, conn: Connection = None):
     get_subjectivity_distribution(db_path: str):
     get_objective_articles(db_path: str, threshold=0.5):
     get_subjective_articles(db_path: str, threshold=0.5):
     correlate_subjectivity_sentiment(db_path: str):
     get_articles_by_sentiment(db_path: str, sentiment):
-    create_analysis_table(db_path):
-    insert_analysis_data(db_path, title, article_text, topics, entities, coherence_score):
+    create_analysis_table(db_path, conn: Connection = None):
+    insert_analysis_data(
+        db_path, title, article_text, topics, entities, coherence_score, conn: Connection = None
+    ):
     drop_table(database_path, table_name):
-    save_analysis_data(db_path, title, article_text, topics, entities, coherence_scores):
+    save_analysis_data(
+        db_path, title, article_text, topics, entities, coherence_scores, conn: Connection = None
+    ):
+    delete_records_from_table(db_path: str, table: str, num_records: int):
 """
 
+import logging
+import re
 import sqlite3
+import threading
+from contextlib import closing
+from functools import lru_cache
+from sqlite3 import Connection
 
 import pandas as pd
 
 from .connection import get_connection
 
+logger = logging.getLogger(__name__)
+
+# Table names are interpolated into SQL, so only plain identifiers are accepted
+_IDENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Most bound parameters SQLite accepts in one statement, raised from 999 in SQLite 3.32.0
+SQLITE_MAX_VARIABLE_NUMBER = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+# Connections kept open between queries, per thread and keyed by database path
+_local = threading.local()
+
+
+def _get_cached_connection(db_path: str) -> Connection:
+    """
+    Returns this thread's cached connection to db_path, opening it on first use.
+
+    Parameters:
+    db_path (str): The file path to the SQLite database.
+
+    Returns:
+    Connection: SQLite3 Connection object.
+    """
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = connections[db_path] = get_connection(db_path)
+    return conn
+
+
+def close_all():
+    """
+    Closes the connections cached by execute_query_with_management in the calling thread.
+
+    Returns:
+    None
+    """
+    connections = getattr(_local, "connections", {})
+    while connections:
+        _, conn = connections.popitem()
+        conn.close()
+
 
 def execute_query_with_management(
     db_path: str,
@@ -38,10 +100,14 @@ def execute_query_with_management(
     params: tuple = (),
     fetch: bool = False,
     many: bool = False,
+    conn: Connection = None,
 ):
     """
-    Executes a query and manages the connection's activity including commit, close, and cursor
-    execute. Can also execute many queries if specified.
+    Executes a query and manages the connection's activity including commit and cursor execute.
+    Can also execute many queries if specified.
+    The connection to db_path is cached per thread and reused by later queries until close_all is
+    called; statements that aren't SELECTs are committed. When a connection is passed in, it is
+    used as is: the caller owns it and is responsible for committing and closing it.
 
     Parameters:
     db_path (str):
@@ -54,13 +120,17 @@ def execute_query_with_management(
         Whether to fetch the results of the query.
     many (bool):
         Whether to execute many queries.
+    conn (Connection, optional):
+        An open connection to use instead of the cached connection to db_path.
 
     Returns:
     list or None: The fetched results if fetch is True, otherwise None.
     """
     result = None
 
-    conn = get_connection(db_path)
+    owns_connection = conn is None
+    if owns_connection:
+        conn = _get_cached_connection(db_path)
     cursor = conn.cursor()
 
     try:
@@ -71,37 +141,128 @@ def execute_query_with_management(
             result = cursor.fetchall()
         else:
             cursor.execute(query, params)
-        conn.commit()
-        print("Query executed successfully.")
+        if owns_connection and not query.lstrip().upper().startswith("SELECT"):
+            conn.commit()
+        logger.debug("Query executed successfully.")
+    except sqlite3.Error:
+        # Don't leave a failed write open on the cached connection
+        if owns_connection:
+            conn.rollback()
+        raise
     finally:
-        conn.close()
+        cursor.close()
 
     return result
 
 
+def iterate_query_results(
+    db_path: str, query: str, params: tuple = (), conn: Connection = None
+):
+    """
+    Executes a query and yields its rows one at a time, streaming them from the cursor instead of
+    fetching all of them at once. A connection opened for db_path is closed once the rows are
+    exhausted; a connection passed in is left open.
+
+    Parameters:
+    db_path (str): The file path to the SQLite database.
+    query (str): The SQL query to be executed.
+    params (tuple): Parameters for the SQL query.
+    conn (Connection, optional): An open connection to use instead of opening one for db_path.
+
+    Yields:
+    tuple: The next row of the query results.
+    """
+    if conn is not None:
+        yield from conn.execute(query, params)
+        return
+
+    with closing(get_connection(db_path)) as conn:
+        yield from conn.execute(query, params)
+
+
+def execute_many_in_transaction(
+    db_path: str, statements: list, conn: Connection = None
+):
+    """
+    Executes several statements inside one transaction that is committed once all of them have
+    run, or rolled back if any of them fails. The statements run on the thread's cached
+    connection to db_path, so its PRAGMAs are only applied when it is first opened.
+    When a connection is passed in, the statements run in the caller's transaction instead, and
+    committing it is left to the caller.
+
+    Parameters:
+    db_path (str): The file path to the SQLite database.
+    statements (list): (query, params) tuples of the statements to execute, in order.
+    conn (Connection, optional): An open connection to use instead of the cached connection to
+        db_path.
+
+    Returns:
+    None
+    """
+    if conn is not None:
+        for query, params in statements:
+            conn.execute(query, params)
+        return
+
+    conn = _get_cached_connection(db_path)
+    cursor = conn.cursor()
+    try:
+        cursor.execute("BEGIN IMMEDIATE")
+        for query, params in statements:
+            cursor.execute(query, params)
+        conn.commit()
+        logger.debug("Transaction executed successfully.")
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
 def save_to_sqlite(
-    df: pd.DataFrame, db_path: str, table_name: str, if_exists: str = "append"
+    df: pd.DataFrame,
+    db_path: str,
+    table_name: str,
+    if_exists: str = "append",
+    conn: Connection = None,
 ) -> None:
     """
     Save a pandas DataFrame to an SQLite database.
+    Rows are written with one multi-row INSERT per chunk, all in a single transaction. The chunks
+    are as large as SQLite's bound parameter limit allows, up to 1000 rows. A connection passed in
+    is left open.
 
     Parameters:
     df (pd.DataFrame): The DataFrame to be saved.
     db_path (str): The file path to the SQLite database.
     table_name (str): The name of the table to save the DataFrame to.
     if_exists (str): What to do if the table already exists.
+    conn (Connection, optional): An open connection to use instead of opening one for db_path.
 
     Returns:
     None
     """
-    with get_connection(db_path) as conn:  # Use get_connection
+    chunksize = max(min(1000, SQLITE_MAX_VARIABLE_NUMBER // max(len(df.columns), 1)), 1)
+    if conn is None:
+        with closing(get_connection(db_path)) as conn:
+            save_to_sqlite(df, db_path, table_name, if_exists, conn)
+        return
+
+    with conn:
         df.to_sql(
-            table_name, con=conn, if_exists=if_exists, index=False, chunksize=1000
+            table_name,
+            con=conn,
+            if_exists=if_exists,
+            index=False,
+            chunksize=chunksize,
+            method="multi",
         )
-    print("Data saved to SQLite successfully.")
+    logger.debug("Data saved to SQLite successfully.")
 
 
-def save_topics_to_db(db_path: str, sentiment: str, topics: str):
+def save_topics_to_db(
+    db_path: str, sentiment: str, topics: str, conn: Connection = None
+):
     """
     Saves topics to the database.
 
@@ -109,26 +270,31 @@ def save_topics_to_db(db_path: str, sentiment: str, topics: str):
     db_path (str): The file path to the SQLite database.
     sentiment (str): The sentiment of the topics.
     topics (str): The topics to be saved.
+    conn (Connection, optional): An open connection to use instead of opening one for db_path.
 
     Returns:
     None
     """
-    execute_query_with_management(
-        db_path, "CREATE TABLE IF NOT EXISTS topics (sentiment TEXT, topics TEXT)"
-    )
-    execute_query_with_management(
+    execute_many_in_transaction(
         db_path,
-        "INSERT INTO topics (sentiment, topics) VALUES (?, ?)",
-        (sentiment, str(topics)),
+        [
+            ("CREATE TABLE IF NOT EXISTS topics (sentiment TEXT, topics TEXT)", ()),
+            (
+                "INSERT INTO topics (sentiment, topics) VALUES (?, ?)",
+                (sentiment, str(topics)),
+            ),
+        ],
+        conn=conn,
     )
 
 
-def create_article_analysis_table(db_path: str):
+def create_article_analysis_table(db_path: str, conn: Connection = None):
     """
-    Creates the article_analysis table if it doesn't exist.
+    Creates the article_analysis table and its sentiment index if they don't exist.
 
     Parameters:
     db_path (str): The file path to the SQLite database.
+    conn (Connection, optional): An open connection to use instead of opening one for db_path.
 
     Returns:
     None
@@ -144,16 +310,25 @@ def create_article_analysis_table(db_path: str):
             topics TEXT
         )
     """
-    execute_query_with_management(db_path, create_table_query)
+    execute_query_with_management(db_path, create_table_query, conn=conn)
+    execute_query_with_management(
+        db_path,
+        "CREATE INDEX IF NOT EXISTS idx_article_analysis_sentiment "
+        "ON article_analysis (sentiment)",
+        conn=conn,
+    )
 
 
-def insert_article_analysis(db_path: str, results: list):
+def insert_article_analysis(db_path: str, results: list, conn: Connection = None):
     """
     Inserts article analysis results into the article_analysis table.
+    All rows are inserted with a single executemany call inside one transaction. When a connection
+    is passed in, committing the transaction is left to the caller.
 
     Parameters:
     db_path (str): The file path to the SQLite database.
-    results (list): The analysis results to be inserted.
+    results (iterable): The analysis results to be inserted.
+    conn (Connection, optional): An open connection to use instead of opening one for db_path.
 
     Returns:
     None
@@ -169,16 +344,26 @@ def insert_article_analysis(db_path: str, results: list):
             , topics)
         VALUES (?, ?, ?, ?, ?, ?, ?)
     """
-    execute_query_with_management(db_path, insert_query, results, many=True)
+    if conn is not None:
+        conn.executemany(insert_query, results)
+        return
+
+    with closing(get_connection(db_path)) as conn:
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(insert_query, results)
 
 
-def get_article_analysis_topics_by_sentiment(db_path: str, sentiment):
+def get_article_analysis_topics_by_sentiment(
+    db_path: str, sentiment, conn: Connection = None
+):
     """
     Retrieves article analysis topics by sentiment.
 
     Parameters:
     db_path (str): The file path to the SQLite database.
     sentiment (str): The sentiment to filter by.
+    conn (Connection, optional): An open connection to use instead of opening one for db_path.
 
     Returns:
     list: The retrieved topics.
@@ -188,21 +373,46 @@ def get_article_analysis_topics_by_sentiment(db_path: str, sentiment):
         "SELECT title, article_text, topics FROM article_analysis WHERE sentiment = ?",
         (sentiment,),
         fetch=True,
+        conn=conn,
     )
 
 
-def get_articles(db_path: str):
+def iterate_article_topics_by_sentiment(
+    db_path: str, sentiment, conn: Connection = None
+):
+    """
+    Retrieves article titles and topics by sentiment, one row at a time.
+    Unlike get_article_analysis_topics_by_sentiment, the article text is never read.
+
+    Parameters:
+    db_path (str): The file path to the SQLite database.
+    sentiment (str): The sentiment to filter by.
+    conn (Connection, optional): An open connection to use instead of opening one for db_path.
+
+    Returns:
+    Iterator: An iterator over (title, topics) tuples.
+    """
+    return iterate_query_results(
+        db_path,
+        "SELECT title, topics FROM article_analysis WHERE sentiment = ?",
+        (sentiment,),
+        conn=conn,
+    )
+
+
+def get_articles(db_path: str, conn: Connection = None):
     """
     Retrieves articles from the database.
 
     Parameters:
     db_path (str): The file path to the SQLite database.
+    conn (Connection, optional): An open connection to use instead of opening one for db_path.
 
     Returns:
     list: The retrieved articles.
     """
     return execute_query_with_management(
-        db_path, "SELECT Title, Article_Text FROM articles", fetch=True
+        db_path, "SELECT Title, Article_Text FROM articles", fetch=True, conn=conn
     )
 
 
@@ -293,34 +503,78 @@ def get_articles_by_sentiment(db_path: str, sentiment):
     )
 
 
-def create_analysis_table(db_path):
+CREATE_ANALYSIS_TABLE_QUERY = """CREATE TABLE IF NOT EXISTS article_topics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT,
+    article_text TEXT,
+    topics TEXT,
+    entities TEXT,
+    c_v TEXT,
+    u_mass TEXT,
+    c_uci TEXT,
+    c_npmi TEXT
+)"""
+
+INSERT_ANALYSIS_DATA_QUERY = """INSERT INTO article_topics (
+    title,
+    article_text,
+    topics,
+    entities,
+    c_v,
+    u_mass,
+    c_uci,
+    c_npmi)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def create_analysis_table(db_path, conn: Connection = None):
     """
-    Creates the article_analysis table if it doesn't exist.
+    Creates the article_topics table if it doesn't exist.
 
     Parameters:
     db_path (str): The file path to the SQLite database.
+    conn (Connection, optional): An open connection to use instead of opening one for db_path.
 
     Returns:
     None
     """
-    execute_query_with_management(
-        db_path,
-        """CREATE TABLE IF NOT EXISTS article_analysis (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT,
-            article_text TEXT,
-            topics TEXT,
-            entities TEXT,
-            c_v TEXT,
-            u_mass TEXT,
-            c_uci TEXT,
-            c_npmi TEXT
-        )""",
+    execute_query_with_management(db_path, CREATE_ANALYSIS_TABLE_QUERY, conn=conn)
+
+
+def _analysis_data_params(title, article_text, topics, entities, coherence_score):
+    """
+    Builds the parameters of INSERT_ANALYSIS_DATA_QUERY for one article.
+
+    Parameters:
+    title (str): The title of the article.
+    article_text (str): The text of the article.
+    topics (str): The topics of the article.
+    entities (str): The entities in the article.
+    coherence_score (dict): The coherence scores of the article.
+
+    Returns:
+    tuple: The query parameters.
+    """
+    return (
+        title,
+        article_text,
+        topics,
+        entities,
+        coherence_score["c_v"],
+        coherence_score["u_mass"],
+        coherence_score["c_uci"],
+        coherence_score["c_npmi"],
     )
 
 
 def insert_analysis_data(
-    db_path, title, article_text, topics, entities, coherence_score
+    db_path,
+    title,
+    article_text,
+    topics,
+    entities,
+    coherence_score,
+    conn: Connection = None,
 ):
     """
     Inserts analysis data into the article_topics table.
@@ -332,35 +586,66 @@ def insert_analysis_data(
     topics (str): The topics of the article.
     entities (str): The entities in the article.
     coherence_score (dict): The coherence scores of the article.
+    conn (Connection, optional): An open connection to use instead of opening one for db_path.
 
     Returns:
     None
     """
-    insert_query = """INSERT INTO article_topics (
-        title, 
-        article_text, 
-        topics, 
-        entities, 
-        c_v, 
-        u_mass, 
-        c_uci, 
-        c_npmi)"""
     execute_query_with_management(
         db_path,
-        insert_query,
-        (
-            title,
-            article_text,
-            topics,
-            entities,
-            coherence_score["c_v"],
-            coherence_score["u_mass"],
-            coherence_score["c_uci"],
-            coherence_score["c_npmi"],
-        ),
+        INSERT_ANALYSIS_DATA_QUERY,
+        _analysis_data_params(title, article_text, topics, entities, coherence_score),
+        conn=conn,
     )
 
 
+def _validate_identifier(name: str) -> str:
+    """
+    Checks that a name is a plain SQL identifier that can safely be interpolated into a query.
+
+    Parameters:
+    name (str): The identifier to check.
+
+    Returns:
+    str: The identifier.
+
+    Raises:
+    ValueError: If the name isn't a plain identifier.
+    """
+    if not isinstance(name, str) or not _IDENT_RE.match(name):
+        raise ValueError(f"Invalid table name: {name!r}")
+    return name
+
+
+@lru_cache(maxsize=64)
+def _drop_table_query(table_name: str) -> str:
+    """
+    Builds the DROP TABLE statement for a table, once per table name.
+
+    Parameters:
+    table_name (str): The name of the table to be dropped.
+
+    Returns:
+    str: The SQL statement.
+    """
+    return f"DROP TABLE IF EXISTS {_validate_identifier(table_name)}"
+
+
+@lru_cache(maxsize=64)
+def _delete_records_query(table: str) -> str:
+    """
+    Builds the statement deleting the first records of a table, once per table name.
+
+    Parameters:
+    table (str): The name of the table to delete records from.
+
+    Returns:
+    str: The SQL statement, taking the number of records as its parameter.
+    """
+    table = _validate_identifier(table)
+    return f"DELETE FROM {table} WHERE rowid IN (SELECT rowid FROM {table} LIMIT ?)"
+
+
 def drop_table(database_path, table_name):
     """
     Drops a table from the SQLite database.
@@ -371,21 +656,30 @@ def drop_table(database_path, table_name):
 
     Returns:
     None
+
+    Raises:
+    ValueError: If the table name isn't a plain identifier.
     """
+    query = _drop_table_query(table_name)
     try:
-        execute_query_with_management(
-            database_path, f"DROP TABLE IF EXISTS {table_name}"
-        )
-        print(f"Table '{table_name}' dropped successfully.")
+        execute_query_with_management(database_path, query)
+        logger.debug("Table '%s' dropped successfully.", table_name)
     except sqlite3.Error as e:
-        print(f"Error occurred: {e}")
+        logger.error("Error occurred: %s", e)
 
 
 def save_analysis_data(
-    db_path, title, article_text, topics, entities, coherence_scores
+    db_path,
+    title,
+    article_text,
+    topics,
+    entities,
+    coherence_scores,
+    conn: Connection = None,
 ):
     """
-    Saves analysis data to the database.
+    Saves analysis data to the database, creating the table and inserting the data in one
+    transaction.
 
     Parameters:
     db_path (str): The file path to the SQLite database.
@@ -394,29 +688,40 @@ def save_analysis_data(
     topics (str): The topics of the article.
     entities (str): The entities in the article.
     coherence_scores (dict): The coherence scores of the article.
+    conn (Connection, optional): An open connection to use instead of opening one for db_path.
 
     Returns:
     None
     """
-    create_analysis_table(db_path)
-    insert_analysis_data(
-        db_path, title, article_text, topics, entities, coherence_scores
+    execute_many_in_transaction(
+        db_path,
+        [
+            (CREATE_ANALYSIS_TABLE_QUERY, ()),
+            (
+                INSERT_ANALYSIS_DATA_QUERY,
+                _analysis_data_params(
+                    title, article_text, topics, entities, coherence_scores
+                ),
+            ),
+        ],
+        conn=conn,
     )
 
 
 def delete_records_from_table(db_path: str, table: str, num_records: int):
     """
-    Deletes a specified number of records from the articles table.
+    Deletes a specified number of records from the given table.
 
     Parameters:
     db_path (str): The file path to the SQLite database.
+    table (str): The name of the table to delete records from.
     num_records (int): The number of records to delete.
 
     Returns:
     None
+
+    Raises:
+    ValueError: If the table name isn't a plain identifier.
     """
-    delete_query = (
-        f"DELETE FROM {table} WHERE rowid IN (SELECT rowid FROM articles LIMIT ?)"
-    )
-    execute_query_with_management(db_path, delete_query, (num_records,))
-    print(f"{num_records} records deleted from the articles table.")
+    execute_query_with_management(db_path, _delete_records_query(table), (num_records,))
+    logger.debug("%d records deleted from the %s table.", num_records, table)
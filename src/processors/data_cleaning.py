@@ -2,62 +2,109 @@
 This module provides functions to clean article data from a DataFrame or an SQLite database.
 
 Functions:
-- clean_article_data_from(df: pd.DataFrame = None, sqlite_path: str = None) -> pd.DataFrame:
+- clean_article_data_from(
+    df: pd.DataFrame = None, sqlite_path: str = None, chunksize: int = None
+) -> pd.DataFrame | Iterator[pd.DataFrame]:
     Cleans article data from either a DataFrame or an SQLite database.
         df (pd.DataFrame, optional): DataFrame with 'Title' and 'Article_Text' columns.
         sqlite_path (str, optional): Path to the SQLite database file.
+        chunksize (int, optional): Number of rows to read from the SQLite database at a time.
     Raises:
         ValueError: If both 'df' and 'sqlite_path' are provided or neither is provided.
 """
 
+from collections.abc import Iterator
+from contextlib import closing
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from ..database.connection import get_connection
 from .duplicate_removal import remove_similar_titles
 
+# RE2 equivalent of Python's r"[^\w\s]": RE2's \w and \s only cover ASCII, so the Unicode
+# letters, numbers and separators Python matches are listed explicitly
+_PUNCT_PATTERN = r"[^\p{L}\p{N}_\s\p{Z}\x0b\x1c-\x1f\x85]"
+
+_SCHEMA = pa.schema([("Title", pa.string()), ("Article_Text", pa.string())])
+
 
-def _clean_from_sqlite(sqlite_path: str) -> pd.DataFrame:
+def _clean_from_sqlite(
+    sqlite_path: str, chunksize: int = 50_000
+) -> Iterator[pd.DataFrame]:
     """
-    Cleans the data from the SQLite database containing article titles and texts.
+    Cleans the data from the SQLite database containing article titles and texts, reading and
+    cleaning it one chunk of rows at a time. Rows whose title was already seen in an earlier chunk
+    are dropped, so titles stay unique across chunks. Rows without a title are kept, like within
+    a chunk.
 
     Parameters:
-    sq
-    lite_path (str): Path to the SQLite database file.
+    sqlite_path (str): Path to the SQLite database file.
+    chunksize (int, optional): Number of rows per chunk. If None, the whole table is read as a
+        single chunk.
 
-    Returns:
-    pd.DataFrame: Cleaned DataFrame with TF-IDF features added.
+    Yields:
+    pd.DataFrame: The next cleaned chunk.
     """
-    with get_connection(sqlite_path) as conn:
-        df = pd.read_sql_query("SELECT * FROM articles", conn)
-    return _clean_from_dataframe(df)
+    seen_titles = set()
+    with closing(get_connection(sqlite_path)) as conn:
+        chunks = pd.read_sql_query("SELECT * FROM articles", conn, chunksize=chunksize)
+        if chunksize is None:
+            chunks = [chunks]
+        for chunk in chunks:
+            df = _clean_from_dataframe(chunk)
+            df = df[(df["Title"] == "") | ~df["Title"].isin(seen_titles)]
+            seen_titles.update(df["Title"])
+            seen_titles.discard("")
+            yield df
 
 
 def _clean_from_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """
     Cleans the given DataFrame containing article titles and texts.
+    Missing values, exact duplicates and punctuation are handled on Arrow string columns, before
+    similar titles are removed.
 
     Parameters:
     df (pd.DataFrame): DataFrame with 'Title' and 'Article_Text' columns.
 
     Returns:
-    pd.DataFrame: Cleaned DataFrame with TF-IDF features added.
+    pd.DataFrame: Cleaned DataFrame with 'Title' and 'Article_Text' columns.
     """
+    table = pa.Table.from_pandas(
+        df[["Title", "Article_Text"]], schema=_SCHEMA, preserve_index=False
+    )
+
     # 1. Handling Missing Values
-    df.fillna({"Title": "", "Article_Text": ""}, inplace=True)
+    titles = pc.fill_null(table["Title"], "")
+    texts = pc.fill_null(table["Article_Text"], "")
 
     # 2. Removing Duplicates
-    df.drop_duplicates(inplace=True)
-    df = remove_similar_titles(df)
+    # Keep the first row of every title; rows without a title are only duplicates of rows with
+    # the same text
+    text_keys = pc.if_else(pc.equal(titles, ""), texts, "")
+    keys = pa.table(
+        {
+            "Title": titles,
+            "Text_Key": text_keys,
+            "Row": np.arange(table.num_rows),
+        }
+    )
+    first_rows = keys.group_by(["Title", "Text_Key"]).aggregate([("Row", "min")])
+    rows = np.sort(first_rows["Row_min"].to_numpy())
 
     # 3. Text Data Cleaning
-    df["Article_Text"] = df["Article_Text"].str.replace(r"[^\w\s]", "", regex=True)
+    texts = pc.replace_substring_regex(pc.take(texts, rows), _PUNCT_PATTERN, "")
 
-    return df
+    df = pa.table({"Title": pc.take(titles, rows), "Article_Text": texts}).to_pandas()
+    return remove_similar_titles(df)
 
 
 def clean_article_data_from(
-    df: pd.DataFrame = None, sqlite_path: str = None
-) -> pd.DataFrame:
+    df: pd.DataFrame = None, sqlite_path: str = None, chunksize: int = None
+) -> pd.DataFrame | Iterator[pd.DataFrame]:
     """
     Cleans article data from either a DataFrame or an SQLite database.
     This function takes either a pandas DataFrame or a path to an SQLite database,
@@ -67,9 +114,13 @@ def clean_article_data_from(
     df (pd.DataFrame, optional): The DataFrame containing the article data to be cleaned.
     sqlite_path (str, optional): The file path to the SQLite database containing the article
         data to be cleaned.
+    chunksize (int, optional): Number of rows to read from the SQLite database at a time. When
+        given, the cleaned chunks are returned as an iterator instead of a single DataFrame, and
+        similar titles are only removed within each chunk.
 
     Returns:
-    pd.DataFrame: A DataFrame containing the cleaned article data.
+    pd.DataFrame or Iterator[pd.DataFrame]: A DataFrame containing the cleaned article data, or
+        an iterator over cleaned chunks of it if chunksize is given.
 
     Raises:
     ValueError: If both 'df' and 'sqlite_path' are provided, or if neither is provided.
@@ -79,5 +130,6 @@ def clean_article_data_from(
     if df is not None:
         return _clean_from_dataframe(df)
     if sqlite_path is not None:
-        return _clean_from_sqlite(sqlite_path)
+        chunks = _clean_from_sqlite(sqlite_path, chunksize=chunksize)
+        return chunks if chunksize is not None else next(chunks)
     raise ValueError("At least one parameter ('df' or 'sqlite_path') must be provided.")
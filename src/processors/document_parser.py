@@ -1,49 +1,132 @@
 """
-This module provides functions to parse and extract data from a Word document (.docx) using the
-    `python-docx` library.
-It includes functions to remove paragraphs before a specific heading and to extract data between
+This module provides functions to parse and extract data from a Word document (.docx), streaming
+    its paragraphs from the document XML with `lxml`.
+It includes functions to read the paragraphs after a specific heading and to extract data between
     specific headings.
 Functions:
-    collect_objects_after_heading2(document: Document) -> Document:
-        Removes all paragraphs in the given document that appear before the first occurrence of a
-        paragraph with the style "Heading 2".
-    collect_objects_between_heading3(document: Document) -> pd.DataFrame:
+    extract_objects_from_paragraphs(paragraphs: Iterable[str]) -> pd.DataFrame:
         Extracts data from paragraphs between "Heading 3" styled paragraphs and returns it as a
         DataFrame.
     parse_document(file_path: str) -> pd.DataFrame:
         Parses the document at the given file path, extracts relevant data, and returns it as a
         DataFrame.
-
-Returns:
-    _type_: _description_
 """
 
 import re
+import zipfile
+from itertools import dropwhile
 
-import docx
 import pandas as pd
-
-
-def collect_objects_from_docx(document: docx.Document):
+from lxml import etree
+
+# Title paragraph of an article, e.g. "1.2 - Source: Title (12 May, ...)"
+_HEADING3_RE = re.compile(
+    r"(\d+\.\d+) - (.+?): (.+) \((\d{1,2}\s(?:[A-Za-z]+))"
+    r",( [\w ,-]+)?( \d+.?\w+ uvm;)?( [\w ,-]+)?\)"
+)
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_BODY = f"{_W}body"
+_PARAGRAPH = f"{_W}p"
+_RUN = f"{_W}r"
+_HYPERLINK = f"{_W}hyperlink"
+_TEXT = f"{_W}t"
+_BREAK = f"{_W}br"
+# Run content that python-docx renders as a character in a paragraph's text
+_RUN_CHARACTERS = {
+    f"{_W}tab": "\t",
+    f"{_W}ptab": "\t",
+    f"{_W}cr": "\n",
+    f"{_W}noBreakHyphen": "-",
+}
+
+
+def _heading2_style_ids(docx_file):
+    """
+    Finds the ids of the "Heading 2" paragraph styles of a document.
+    Args:
+        docx_file (zipfile.ZipFile): The opened document.
+    Returns:
+        set: The style ids, usually just "Heading2".
     """
-    Removes all paragraphs in the given document that appear before the first
-    occurrence of a paragraph with the style "Heading 2".
+    try:
+        styles = etree.fromstring(docx_file.read("word/styles.xml"))
+    except KeyError:
+        return {"Heading2"}
+    style_ids = set()
+    for style in styles.iter(f"{_W}style"):
+        name = style.find(f"{_W}name")
+        if name is not None and name.get(f"{_W}val", "").lower() == "heading 2":
+            style_ids.add(style.get(f"{_W}styleId"))
+    return style_ids
+
+
+def _run_text(run):
+    """
+    Gets the text of a run element the way python-docx does. Line breaks are rendered as newlines,
+    while page and column breaks are dropped.
     Args:
-        document (Document): The document object to process.
+        run (etree.Element): The w:r element.
     Returns:
-        Document: The modified document with paragraphs before the first
-        "Heading 2" removed.
+        str: The text of the run.
+    """
+    parts = []
+    for child in run:
+        if child.tag == _TEXT:
+            parts.append(child.text or "")
+        elif child.tag == _BREAK:
+            if child.get(f"{_W}type", "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif child.tag in _RUN_CHARACTERS:
+            parts.append(_RUN_CHARACTERS[child.tag])
+    return "".join(parts)
+
+
+def _paragraph_text(paragraph):
     """
-    # Iterate through paragraphs
-    for paragraph in document.paragraphs[:]:  # Create a copy of the list
-        if paragraph.style.name == "Heading 2":
-            break  # Stop processing once we find the Heading 2
+    Gets the text of a paragraph element the way python-docx does: the text of its runs and of
+    the runs of its hyperlinks. Content nested deeper, such as text boxes, is left out.
+    Args:
+        paragraph (etree.Element): The w:p element.
+    Returns:
+        str: The text of the paragraph.
+    """
+    parts = []
+    for child in paragraph:
+        if child.tag == _RUN:
+            parts.append(_run_text(child))
+        elif child.tag == _HYPERLINK:
+            parts.extend(_run_text(run) for run in child.iterchildren(_RUN))
+    return "".join(parts)
 
-        # Remove the paragraph if we haven't found Heading 2 yet
-        paragraph._element.getparent().remove(paragraph._element)
 
-    # Return the modified document
-    return document  # Return the document after removing paragraphs before Heading 2
+def _iter_docx_paragraphs(file_path):
+    """
+    Streams the body paragraphs of a document, without loading the whole document tree.
+    Paragraphs nested in tables or text boxes are skipped, like python-docx's
+    Document.paragraphs does, and every body element is freed once it has been read.
+    Args:
+        file_path (str): The path to the .docx file.
+    Yields:
+        tuple: The style id of the next paragraph, or None if it has none, and its text.
+    """
+    style_path = f"{_W}pPr/{_W}pStyle"
+    with (
+        zipfile.ZipFile(file_path) as docx_file,
+        docx_file.open("word/document.xml") as xml,
+    ):
+        for _, element in etree.iterparse(xml, tag=_PARAGRAPH):
+            parent = element.getparent()
+            if parent is None or parent.tag != _BODY:
+                continue
+            style = element.find(style_path)
+            style_id = style.get(f"{_W}val") if style is not None else None
+            yield style_id, _paragraph_text(element)
+
+            # Free this paragraph and the body elements before it
+            element.clear()
+            while element.getprevious() is not None:
+                del parent[0]
 
 
 def extract_objects_from_paragraphs(paragraphs):
@@ -52,76 +135,61 @@ def extract_objects_from_paragraphs(paragraphs):
     This function searches through the paragraphs, identifies sections that match a specific
     pattern following a Heading 3 paragraph, and extracts relevant information to populate a
     DataFrame. The extracted information includes the title and the article text, which is
-    collected until a "Back to Top" paragraph is encountered.
-    Args:
-        paragraphs (list): The list of paragraphs to be parsed.
-    Returns:
-        pd.DataFrame: A DataFrame containing the extracted data with columns "Title"
-                      and "Article_Text".
-    """
-    pattern = (
-        r"(\d+\.\d+) - (.+?): (.+) \((\d{1,2}\s(?:[A-Za-z]+))"
-        r",( [\w ,-]+)?( \d+.?\w+ uvm;)?( [\w ,-]+)?\)"
-    )
-    df = pd.DataFrame(columns=["Title", "Article_Text"])
-
-    for i, paragraph in enumerate(paragraphs):
-        data = {}
-        match = re.match(pattern, paragraph)
-
-        if match:
-            article_text = []
-            for para in paragraphs[i + 2 :]:
-                if para.strip() == "Back to Top":
-                    break
-                article_text.append(para.strip())
-
-            data.update(
-                {
-                    "Title": paragraph,
-                    "Article_Text": " ".join(article_text),
-                }
-            )
-
-            new_data_df = pd.DataFrame([data])
-            df = pd.concat([new_data_df, df], ignore_index=True)
-
-    return df
-
-
-def extract_objects_from_docx(document: docx.Document):
-    """
-    Extracts and collects objects between Heading 3 paragraphs in a document.
-    This function searches through the paragraphs of a given document, identifies
-    paragraphs that match a specific pattern following a Heading 3 paragraph, and
-    extracts relevant information to populate a DataFrame. The extracted information
-    includes the title and the article text, which is collected until a "Back to Top"
-    paragraph is encountered.
+    collected until a "Back to Top" paragraph or the next title is encountered. The paragraph
+    right after a title is skipped. The paragraphs are scanned in a single pass.
     Args:
-        document (Document): The document object containing paragraphs to be parsed.
+        paragraphs (iterable): The paragraphs to be parsed, stripped of surrounding
+            whitespace.
     Returns:
         pd.DataFrame: A DataFrame containing the extracted data with columns "Title"
                       and "Article_Text".
     """
-    paragraphs = [paragraph.text for paragraph in document.paragraphs]
-
-    return extract_objects_from_paragraphs(paragraphs)
+    titles, texts = [], []
+    title = None
+    article_text = []
+    skip = 0
+
+    for paragraph in paragraphs:
+        if _HEADING3_RE.match(paragraph):
+            if title is not None:
+                titles.append(title)
+                texts.append(" ".join(article_text))
+            title, article_text, skip = paragraph, [], 1
+        elif title is None:
+            continue
+        elif skip:
+            skip -= 1
+        elif paragraph == "Back to Top":
+            titles.append(title)
+            texts.append(" ".join(article_text))
+            title = None
+        else:
+            article_text.append(paragraph)
+
+    if title is not None:
+        titles.append(title)
+        texts.append(" ".join(article_text))
+
+    return pd.DataFrame({"Title": titles, "Article_Text": texts})
 
 
 def parse_document(file_path):
     """
-    Parses the document at the given file path, extracts relevant data, and appends it to the
-    provided DataFrame.
+    Parses the document at the given file path and extracts the articles after its first
+    "Heading 2" paragraph. The paragraphs are streamed from the document XML.
 
     Args:
-        df (pd.DataFrame): The DataFrame to which the extracted data will be appended.
         file_path (str): The path to the document file to be parsed.
 
     Returns:
-        pd.DataFrame: The updated DataFrame with the extracted data appended.
+        pd.DataFrame: A DataFrame containing the extracted data with columns "Title" and
+            "Article_Text".
     """
-    document = docx.Document(file_path)
-    document_after_heading2 = collect_objects_from_docx(document)
+    with zipfile.ZipFile(file_path) as docx_file:
+        heading2_style_ids = _heading2_style_ids(docx_file)
 
-    df_between_heading3 = extract_objects_from_docx(document_after_heading2)
-    return df_between_heading3
+    paragraphs = dropwhile(
+        lambda paragraph: paragraph[0] not in heading2_style_ids,
+        _iter_docx_paragraphs(file_path),
+    )
+    return extract_objects_from_paragraphs(text.strip() for _, text in paragraphs)
@@ -2,35 +2,234 @@
 This module provides functions to remove similar article titles from a DataFrame.
 
 Functions:
-- remove_similar_titles(df: pd.DataFrame, threshold: int = 95) -> pd.DataFrame:
+- remove_similar_titles(
+    df: pd.DataFrame, threshold: int = 95, method: str = "blocking"
+) -> pd.DataFrame:
     Removes rows with similar article titles based on a similarity threshold.
         df (pd.DataFrame): DataFrame with 'Title' column.
         threshold (int, optional): Similarity threshold for removing titles. Default is 95.
+        method (str, optional): How candidate pairs are found, "blocking" or "lsh".
+            Default is "blocking".
 """
 
-from fuzzywuzzy import fuzz
+import re
+from collections import defaultdict
 
+import numpy as np
+from datasketch import MinHash, MinHashLSH
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
 
-def remove_similar_titles(df, threshold=95):
+from .levenshtein import encode_titles, indel_ratios
+
+# Without RapidFuzz, titles are scored with the compiled fallback in levenshtein instead
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Tokens shorter than this are too common to block titles on
+MIN_TOKEN_LENGTH = 4
+
+# Tokens found in more than this fraction of the titles (and in more than
+# MIN_COMMON_TOKEN_TITLES titles) are too common to block titles on either
+MAX_TOKEN_FREQUENCY = 0.05
+MIN_COMMON_TOKEN_TITLES = 50
+
+# MinHash settings for the "lsh" method. The Jaccard threshold of the character shingles sits
+# below the ratio threshold, since a single edit changes several shingles at once.
+LSH_THRESHOLD = 0.8
+LSH_NUM_PERM = 128
+SHINGLE_SIZE = 3
+
+
+def _blocking_tokens(title):
+    """
+    Get the tokens a title is blocked on: its lowercased words that are long enough and not
+    stopwords.
+
+    Args:
+        title (str): The title to tokenize.
+
+    Returns:
+        set: The blocking tokens of the title.
+    """
+    return {
+        token
+        for token in _TOKEN_RE.findall(title.lower())
+        if len(token) >= MIN_TOKEN_LENGTH and token not in ENGLISH_STOP_WORDS
+    }
+
+
+def _blocking_candidates(titles):
+    """
+    Find the candidate matches of every title through the rare blocking tokens they share.
+    Titles whose blocking tokens are all common are compared with all the others.
+
+    Args:
+        titles (list): The titles to match.
+
+    Returns:
+        callable: A function returning the indices of the candidate matches of the title at the
+            given index.
+    """
+    tokens = [_blocking_tokens(title) for title in titles]
+
+    postings = defaultdict(set)
+    for index, title_tokens in enumerate(tokens):
+        for token in title_tokens:
+            postings[token].add(index)
+
+    # Drop the common tokens, whose postings would make every title a candidate of most others
+    max_titles = max(MAX_TOKEN_FREQUENCY * len(titles), MIN_COMMON_TOKEN_TITLES)
+    common = {token for token, indices in postings.items() if len(indices) > max_titles}
+    for token in common:
+        del postings[token]
+    tokens = [title_tokens - common for title_tokens in tokens]
+    unblocked = {index for index, title_tokens in enumerate(tokens) if not title_tokens}
+
+    def candidates(i):
+        if not tokens[i]:
+            return range(len(titles))
+        return set(unblocked).union(*(postings[token] for token in tokens[i]))
+
+    return candidates
+
+
+def _minhash(title):
+    """
+    Compute the MinHash signature of the character shingles of a title.
+
+    Args:
+        title (str): The title to hash.
+
+    Returns:
+        MinHash: The signature of the title.
+    """
+    minhash = MinHash(num_perm=LSH_NUM_PERM)
+    shingles = {
+        title[start : start + SHINGLE_SIZE]
+        for start in range(max(len(title) - SHINGLE_SIZE + 1, 1))
+    }
+    for shingle in shingles:
+        minhash.update(shingle.encode("utf8"))
+    return minhash
+
+
+def _lsh_candidates(titles):
+    """
+    Find the candidate matches of every title through MinHash LSH over character shingles.
+
+    Args:
+        titles (list): The titles to match.
+
+    Returns:
+        callable: A function returning the indices of the candidate matches of the title at the
+            given index.
+    """
+    lsh = MinHashLSH(threshold=LSH_THRESHOLD, num_perm=LSH_NUM_PERM)
+    minhashes = [_minhash(title) for title in titles]
+    for index, minhash in enumerate(minhashes):
+        lsh.insert(index, minhash)
+
+    def candidates(i):
+        return lsh.query(minhashes[i])
+
+    return candidates
+
+
+def _title_scorer(titles, threshold):
+    """
+    Get a function scoring the similarity of titles with fuzz.ratio, each title against all its
+    candidates in a single process.cdist call, or with its compiled fallback when RapidFuzz isn't
+    installed.
+
+    Args:
+        titles (list): The titles to score.
+        threshold (int): The similarity threshold; lower scores may be reported as 0.
+
+    Returns:
+        callable: A function returning the similarity (0-100) of the title at the given index to
+            each of the titles at the given candidate indices.
+    """
+    if fuzz is None:
+        encoded = encode_titles(titles)
+        return lambda i, candidates: indel_ratios(encoded, i, candidates)
+
+    def score(i, candidates):
+        if len(candidates) == 0:
+            return np.zeros(0)
+        return process.cdist(
+            [titles[i]],
+            [titles[j] for j in candidates],
+            scorer=fuzz.ratio,
+            score_cutoff=threshold,
+            dtype=np.float64,
+        )[0]
+
+    return score
+
+
+_CANDIDATE_FINDERS = {"blocking": _blocking_candidates, "lsh": _lsh_candidates}
+
+
+def remove_similar_titles(df, threshold=95, method="blocking"):
     """
     Remove rows from a DataFrame that have similar titles based on a given similarity threshold.
+    The title of every row that is kept drops all later rows whose title is similar to it.
+
+    Only candidate pairs whose lengths are close enough for the similarity to exceed the threshold
+    are scored. With the "blocking" method, titles are candidates when they share a rare blocking
+    token, and titles without rare blocking tokens are compared with all the others. With the
+    "lsh" method, titles are candidates when their MinHash signatures collide, which scales to far
+    more titles at the cost of possibly missing some similar pairs.
 
     Args:
         df (pandas.DataFrame): The DataFrame containing a column named 'Title' with text data.
         threshold (int, optional): The similarity threshold (0-100) above which titles are
         considered similar. Defaults to 95.
+        method (str, optional): How candidate pairs are found, "blocking" or "lsh". Defaults to
+        "blocking".
 
     Returns:
         pandas.DataFrame: The DataFrame with similar titles removed.
+
+    Raises:
+        ValueError: If the method is unknown.
     """
-    to_drop = set()
-    for i in range(len(df)):
-        if i in to_drop:
+    if method not in _CANDIDATE_FINDERS:
+        raise ValueError(f"Unknown method '{method}', expected 'blocking' or 'lsh'.")
+
+    titles = df["Title"].tolist()
+    lengths = np.array([len(title) for title in titles])
+    find_candidates = _CANDIDATE_FINDERS[method](titles)
+    score = _title_scorer(titles, threshold)
+
+    # A repeated title is always dropped: either by its first occurrence, or by whichever title
+    # dropped that first occurrence. Empty titles never score as similar, so they are kept.
+    dropped = np.zeros(len(titles), dtype=bool)
+    seen = set()
+    for i, title in enumerate(titles):
+        if title in seen:
+            dropped[i] = True
+        elif title:
+            seen.add(title)
+
+    for i in range(len(titles)):
+        if dropped[i]:
             continue
-        for j in range(i + 1, len(df)):
-            if j in to_drop:
-                continue
-            similarity = fuzz.ratio(df.iloc[i]["Title"], df.iloc[j]["Title"])
-            if similarity > threshold:
-                to_drop.add(j)
-    return df.drop(df.index[list(to_drop)])
+        candidates = np.fromiter(
+            (j for j in find_candidates(i) if j > i), dtype=np.int64
+        )
+        candidates = candidates[~dropped[candidates]]
+
+        # The similarity of two titles is at most 2 * min(a, b) / (a + b) * 100 for lengths a, b
+        shorter = np.minimum(lengths[candidates], lengths[i])
+        total = lengths[candidates] + lengths[i]
+        candidates = candidates[200 * shorter > threshold * total]
+
+        # Scores are rounded to integers like fuzzywuzzy's ratio
+        similarities = np.round(score(i, candidates))
+        dropped[candidates[similarities > threshold]] = True
+    return df.drop(df.index[dropped])
@@ -22,6 +22,7 @@ Notes:
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 import pandas as pd
 
@@ -46,10 +47,10 @@ def process_email_attachments(email_dir: str, attachments_dir: str) -> pd.DataFr
         - The function first parses the emails to extract attachments and save them to the specified
             directory.
         - It then processes each attachment, extracting data from .docx files and concatenating it
-            into a DataFrame.
+            into a DataFrame. The attachments are parsed in parallel, one process per CPU.
         - .pdf files are parsed but their data is not included in the returned DataFrame.
     """
-    data = pd.DataFrame()
+    parsers = {".docx": parse_document, ".pdf": parse_pdf}
 
     print("Extracting data from email attachments...")
     parse_from_path(path_in=email_dir, path_out=attachments_dir)
@@ -58,16 +59,28 @@ def process_email_attachments(email_dir: str, attachments_dir: str) -> pd.DataFr
         print("No attachments found.")
         return pd.DataFrame()
 
-    for filename in os.listdir(attachments_dir):
-        file_path = os.path.join(attachments_dir, filename)
-        if filename.endswith(".docx"):
-            doc_data = parse_document(file_path)
-            print(f"Extracted data from {filename}")
-            data = pd.concat([data, doc_data], ignore_index=True)
-        elif filename.endswith(".pdf"):
-            pdf_data = parse_pdf(file_path)
-            print(f"Extracted data from {filename}")
-            data = pd.concat([data, pdf_data], ignore_index=True)
+    with os.scandir(attachments_dir) as entries:
+        files = []
+        for entry in entries:
+            parser = parsers.get(os.path.splitext(entry.name)[1].lower())
+            if parser is not None and entry.is_file():
+                files.append((entry.name, entry.path, parser))
 
+    with ProcessPoolExecutor() as executor:
+        futures = {
+            executor.submit(parser, file_path): filename
+            for filename, file_path, parser in files
+        }
+        for future in as_completed(futures):
+            future.result()
+            print(f"Extracted data from {futures[future]}")
+
+    # Keep the frames in directory order, whatever order the files finished in
+    frames = [future.result() for future in futures]
+
+    if frames:
+        data = pd.concat(frames, ignore_index=True)
+    else:
+        data = pd.DataFrame(columns=["Title", "Article_Text"])
     print(f"Total articles extracted: {len(data)}")
     return data
@@ -6,8 +6,12 @@ Functions:
     _init_data_paths(out_folder, in_folder=None):
         Initializes the data paths by creating the output folder if it doesn't exist
         and ensuring the input folder exists if provided
-    find_and_save_attachments(msg: Message, save_path):
+    _is_safe_filename(filename):
+        Checks that an attachment filename can only name a file directly in the save directory
+    find_and_save_attachments(msg: Message, save_path, existing: set = None):
         Finds and saves .docx attachments from an email message to a specified directory
+    _process_msg(path, senders, out_folder):
+        Saves the attachments of an email message if it was sent by one of the senders
     parse_from_path(senders: list = None, path_in=DEFAULT_PATH_IN, path_out=DEFAULT_PATH_OUT):
         Parses email messages from a specified input directory and processes them
         based on the sender's email address
@@ -22,6 +26,8 @@ Usage:
 
 import os.path
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 from extract_msg import Message
 
@@ -29,6 +35,15 @@ DEFAULT_SENDER = "vhaofficeofaushivccommunications@va.gov"
 DEFAULT_PATH_IN = "emails"
 DEFAULT_PATH_OUT = "attachments"
 
+# Extensions of the attachments that are saved
+_APPROVED_EXTS = frozenset({".docx", ".pdf"})
+
+# Email address in a sender such as "Name <name@example.com>"
+_SENDER_RE = re.compile(r"<(.+?@.+?)>")
+
+# Characters extract_msg doesn't allow in the filename of a saved attachment
+_INVALID_FILENAME_CHARS = frozenset('\\/:*?"<>|\0')
+
 
 def _init_data_paths(out_folder, in_folder=None):
     """
@@ -41,20 +56,36 @@ def _init_data_paths(out_folder, in_folder=None):
         function will check if it exists.
     """
     # create the output folder if it doesn't exist
-    if not os.path.isdir(out_folder):
-        os.mkdir(out_folder)
+    os.makedirs(out_folder, exist_ok=True)
 
     # make sure the input folder exists
     if in_folder is not None and not os.path.isdir(in_folder):
         print(f"The input folder {in_folder} is required.")
 
 
-def find_and_save_attachments(msg: Message, save_path):
+def _is_safe_filename(filename):
+    """
+    Checks that an attachment filename can only name a file directly in the save directory.
+    Args:
+        filename (str): The filename taken from the attachment.
+    Returns:
+        bool: Whether the filename is safe to save the attachment under.
+    """
+    return (
+        os.path.basename(filename) == filename
+        and filename not in (".", "..")
+        and _INVALID_FILENAME_CHARS.isdisjoint(filename)
+    )
+
+
+def find_and_save_attachments(msg: Message, save_path, existing: set = None):
     """
     Finds and saves .docx attachments from an email message to a specified directory.
     Args:
         msg (Message): The email message object containing attachments.
-        save_path (str): The directory path where attachments will be saved.
+        save_path (str): The directory path where attachments will be saved. It must exist.
+        existing (set, optional): The names of the files already in save_path, updated with
+            the attachments saved. Defaults to listing save_path.
     Returns:
         None
     Raises:
@@ -62,28 +93,73 @@ def find_and_save_attachments(msg: Message, save_path):
     Notes:
         - Only attachments with a .docx extension are saved.
         - Attachments are saved with a timestamp appended to their original filename.
-        - If an attachment has no filename, it is skipped.
+        - If an attachment has no filename, or one with path separators, that is "." or "..",
+        or with characters extract_msg doesn't allow, it is skipped.
     """
-    _init_data_paths(save_path, None)
-    _init_data_paths(save_path)
-    appr_file_types = [".docx", ".pdf"]
+    if existing is None:
+        with os.scandir(save_path) as entries:
+            existing = {entry.name for entry in entries}
 
     for attachment in msg.attachments:
         if attachment.longFilename:
             attachment_filename, extension = os.path.splitext(attachment.longFilename)
-            if extension in appr_file_types:
+            if extension.lower() in _APPROVED_EXTS:
                 new_filename = f"{attachment_filename}{extension}"
-                file_path = os.path.join(save_path, new_filename)
 
-                if not os.path.isfile(file_path):
-                    attachment.save(customPath=save_path, customFilename=new_filename)
-                    print("Saved attachments:", new_filename)
-                else:
+                # the filename comes from the email, so it must not reach outside save_path
+                if not _is_safe_filename(new_filename):
+                    print("Skipping attachment with invalid filename:", new_filename)
+                    continue
+
+                if new_filename in existing:
+                    print("Attachment already exists:", new_filename)
+                    continue
+
+                # create the file exclusively, another process may be saving the same
+                # attachment from a different email
+                try:
+                    with open(os.path.join(save_path, new_filename), "xb") as file:
+                        file.write(attachment.data)
+                except FileExistsError:
                     print("Attachment already exists:", new_filename)
+                else:
+                    print("Saved attachments:", new_filename)
+                existing.add(new_filename)
         else:
             print("Skipping attachment with None filename.")
 
 
+def _process_msg(path, senders, out_folder):
+    """
+    Saves the attachments of an email message if it was sent by one of the senders.
+    It is run in a worker process by parse_from_path.
+    Args:
+        path (str): The path of the .msg file.
+        senders (list): The sender email addresses whose attachments are saved.
+        out_folder (str): The directory path where attachments will be saved.
+    Returns:
+        None
+    """
+    filename = os.path.basename(path)
+    print(f"Processing {filename}...")
+    # open the email message, the attachments are only parsed once they are accessed
+    # and the message is closed whether or not it is skipped
+    with Message(path, delayAttachments=True) as msg:
+        # extract the sender from the email
+        sender = _SENDER_RE.search(msg.sender or "")
+
+        # check if the sender is in the list of senders
+        if sender is None or sender.group(1).lower() not in senders:
+            print(f"Skipping {filename}...")
+            return
+
+        # find and save all attachments, the files already saved are detected when they are
+        # created, so the output folder isn't listed for every message
+        find_and_save_attachments(msg, out_folder, existing=set())
+
+    print("Completed processing:", filename)
+
+
 def parse_from_path(
     senders: list = None, path_in=DEFAULT_PATH_IN, path_out=DEFAULT_PATH_OUT
 ):
@@ -105,6 +181,7 @@ def parse_from_path(
         - Only files with a .msg extension in the input directory are processed.
         - Attachments from the emails of the specified senders are extracted and saved to the output
         directory.
+        - The .msg files are processed in parallel in a pool of worker processes.
     """
     if senders is None or len(senders) == 0:
         senders = [DEFAULT_SENDER]
@@ -114,27 +191,20 @@ def parse_from_path(
 
     _init_data_paths(out_folder, in_folder)
 
-    # iterate over all .msg files in the input folder
-    for filename in os.listdir(in_folder):
-        # skip non-msg files
-        if filename.endswith(".msg"):
-            print(f"Processing {filename}...")
-            file_path = os.path.join(in_folder, filename)
-            # extract the email message
-            msg = Message(file_path)
-
-            # extract the sender from the email
-            match = re.search(r"<(.+?@.+?)>", msg.sender).group(1).lower()
-
-            # check if the sender is in the list of senders
-            if match in senders:
-                # find and save all attachments
-                find_and_save_attachments(msg, out_folder)
-
-                # close the message
-                msg.close()
-
-                print("Completed processing:", filename)
-            else:
-                print(f"Skipping {filename}...")
-                continue
+    # iterate over all .msg files in the input folder, skipping non-msg files
+    with os.scandir(in_folder) as entries:
+        msg_entries = [
+            entry
+            for entry in entries
+            if entry.name.endswith(".msg") and entry.is_file()
+        ]
+
+    with ProcessPoolExecutor() as executor:
+        # consume the results so errors in the workers are raised here
+        for _ in executor.map(
+            _process_msg,
+            [entry.path for entry in msg_entries],
+            repeat(senders),
+            repeat(out_folder),
+        ):
+            pass
@@ -0,0 +1,147 @@
+"""
+This module provides a compiled fallback for RapidFuzz's fuzz.ratio, used to compare titles when
+RapidFuzz isn't installed.
+
+The ratio is the normalized InDel similarity 200 * LCS(a, b) / (len(a) + len(b)), where the
+length of the longest common subsequence is computed with the bit-parallel algorithm of Hyyrö,
+64 characters of the first title per machine word.
+
+Functions:
+- encode_titles(titles: list) -> tuple[np.ndarray, np.ndarray, int]:
+    Encodes titles as dense character ids, concatenated, with the offset of every title.
+- indel_ratios(encoded: tuple, i: int, candidates: np.ndarray) -> np.ndarray:
+    Computes the similarity (0-100) of the title at index i to each of the candidate titles.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+_ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+_ONE = np.uint64(1)
+_ZERO = np.uint64(0)
+
+
+def encode_titles(titles):
+    """
+    Encode titles as dense character ids, so the compiled kernel can index tables by character.
+
+    Args:
+        titles (list): The titles to encode.
+
+    Returns:
+        tuple: The character ids of all the titles, concatenated, the offsets at which each
+            title starts, with the total length as the last offset, and the number of distinct
+            characters.
+    """
+    codes = {}
+    lengths = np.fromiter(
+        (len(title) for title in titles), dtype=np.int64, count=len(titles)
+    )
+    ids = np.fromiter(
+        (codes.setdefault(char, len(codes)) for title in titles for char in title),
+        dtype=np.int32,
+        count=int(lengths.sum()),
+    )
+    offsets = np.zeros(len(titles) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return ids, offsets, len(codes)
+
+
+@njit(cache=True)
+def _popcount(bits):
+    """
+    Count the set bits of a 64-bit word.
+
+    Args:
+        bits (np.uint64): The word.
+
+    Returns:
+        int: The number of set bits.
+    """
+    count = 0
+    while bits:
+        bits &= bits - _ONE
+        count += 1
+    return count
+
+
+@njit(cache=True, parallel=True)
+def _indel_ratios(ids, offsets, n_chars, i, candidates):
+    """
+    Compute the InDel similarity of the title at index i to each of the candidate titles.
+
+    Args:
+        ids (np.ndarray): The concatenated character ids of the titles.
+        offsets (np.ndarray): The offsets at which each title starts.
+        n_chars (int): The number of distinct character ids.
+        i (int): The index of the title to compare.
+        candidates (np.ndarray): The indices of the titles to compare it to.
+
+    Returns:
+        np.ndarray: The similarity (0-100) to each candidate.
+    """
+    start, stop = offsets[i], offsets[i + 1]
+    m = stop - start
+    words = max((m + 63) // 64, 1)
+
+    # Bit masks of the positions of each distinct character in the title, with slots mapping
+    # character ids to their mask
+    slots = np.full(n_chars, -1, dtype=np.int32)
+    distinct = 0
+    for k in range(start, stop):
+        if slots[ids[k]] < 0:
+            slots[ids[k]] = distinct
+            distinct += 1
+    masks = np.zeros((distinct, words), dtype=np.uint64)
+    for k in range(m):
+        masks[slots[ids[start + k]], k // 64] |= _ONE << np.uint64(k % 64)
+
+    scores = np.zeros(len(candidates))
+    for c in prange(len(candidates)):
+        j = candidates[c]
+        total = m + offsets[j + 1] - offsets[j]
+        if total == 0:
+            scores[c] = 100.0
+            continue
+
+        v = np.full(words, _ALL_ONES)
+        for k in range(offsets[j], offsets[j + 1]):
+            slot = slots[ids[k]]
+            if slot < 0:
+                continue
+            # V = (V + U) | (V - U) with U = V & mask, the addition carrying across words
+            carry = _ZERO
+            for w in range(words):
+                vw = v[w]
+                u = vw & masks[slot, w]
+                x = vw + u
+                s = x + carry
+                carry = _ONE if x < vw or s < x else _ZERO
+                v[w] = s | (vw - u)
+
+        # The LCS length is the number of zero bits among the low m bits of V
+        lcs = 0
+        for w in range(words):
+            bits = ~v[w]
+            if w == words - 1 and m % 64:
+                bits &= (_ONE << np.uint64(m % 64)) - _ONE
+            lcs += _popcount(bits)
+        scores[c] = 200.0 * lcs / total
+    return scores
+
+
+def indel_ratios(encoded, i, candidates):
+    """
+    Compute the similarity of the title at index i to each of the candidate titles, matching
+    RapidFuzz's fuzz.ratio. The candidates are compared in parallel.
+
+    Args:
+        encoded (tuple): The titles encoded by encode_titles.
+        i (int): The index of the title to compare.
+        candidates (np.ndarray): The indices of the titles to compare it to.
+
+    Returns:
+        np.ndarray: The similarity (0-100) to each candidate.
+    """
+    ids, offsets, n_chars = encoded
+    return _indel_ratios(ids, offsets, n_chars, i, candidates)
@@ -3,63 +3,85 @@ import re
 import pandas as pd
 import pymupdf
 
+# Title of an article, e.g. "1.2 - Source: Title (12 May, ...)"
+_TITLE_RE = re.compile(
+    r"(\d+\.\d+) - (.+?): (.+) \((\d{1,2}\s(?:[A-Za-z]+))"
+    r",( [\w ,-]+)?( \d+.?\w+ uvm;)?( [\w ,-]+)?\)"
+)
+
+# Markers looked for in every paragraph, found in a single scan
+_MARKER_RE = re.compile(r"Full article text below|Back to Top")
+
 
 def extract_objects_from_paragraphs(articles):
     """
-    Extracts and collects objects between Heading 3 paragraphs in a list of paragraphs.
-    This function searches through the paragraphs, identifies sections that match a specific
-    pattern following a Heading 3 paragraph, and extracts relevant information to populate a
-    DataFrame. The extracted information includes the title and the article text, which is
-    collected until a "Back to Top" paragraph is encountered.
+    Builds a DataFrame from the articles found by get_content, one row per article. The
+    (title, article text) tuples map directly onto the columns, without any further joining.
     Args:
-        paragraphs (list): The list of paragraphs to be parsed.
+        articles (list): The (title, article text) tuples found by get_content, with the
+            article text already joined into a string.
     Returns:
         pd.DataFrame: A DataFrame containing the extracted data with columns "Title"
                       and "Article_Text".
     """
-    df = pd.DataFrame(columns=["Title", "Article_Text"])
-    data = {}
-
-    for title, article_text in articles:
-        data.update(
-            {
-                "Title": title,
-                "Article_Text": " ".join(article_text),
-            }
-        )
+    return pd.DataFrame(articles, columns=["Title", "Article_Text"])
 
-        new_data_df = pd.DataFrame([data])
-        df = pd.concat([new_data_df, df], ignore_index=True)
 
-    return df
+def _combine(paragraph_list, i):
+    """
+    Combines the paragraph at index i with the next two paragraphs.
+    Args:
+        paragraph_list (list): The paragraphs.
+        i (int): The index of the first paragraph.
+    Returns:
+        str: The paragraphs joined with spaces.
+    """
+    return " ".join(paragraph_list[i : i + 3])
 
 
-def get_content(paragraph_list, pattern):
+def get_content(paragraph_list, max_articles=None):
+    """
+    Collects the articles after the "Full article text below" marker of a list of paragraphs.
+    Each article starts with a title and runs until the next "Back to Top" paragraph.
+    Args:
+        paragraph_list (list): The paragraphs of the document.
+        max_articles (int, optional): Stop scanning once this many articles are collected.
+            Defaults to None, scanning all the paragraphs.
+    Returns:
+        list: The (title, article text) tuples of the articles.
+    """
     results = []
     title = None
     begin_reading = False
 
+    # The end-of-contents marker can only be found in a window of paragraphs containing its
+    # first word, so the windows are only combined for those. The flags are padded so the
+    # window of the last paragraphs can be checked without slicing.
+    has_hyperlink = ["Hyperlink" in paragraph for paragraph in paragraph_list]
+    has_hyperlink += [False, False]
+
     for i, paragraph in enumerate(paragraph_list):
-        combined_paragraph = paragraph
-        # Combine current paragraph with the next two paragraphs
-        if i + 1 < len(paragraph_list):
-            combined_paragraph += " " + paragraph_list[i + 1]
-        if i + 2 < len(paragraph_list):
-            combined_paragraph += " " + paragraph_list[i + 2]
+        markers = _MARKER_RE.findall(paragraph)
 
         # skip all content until the text "Full article text below:" is found
-        if (
-            "Full article text below" in paragraph
-            or "Hyperlink to Above    Back to Top" in combined_paragraph
+        if "Full article text below" in markers or (
+            (has_hyperlink[i] or has_hyperlink[i + 1] or has_hyperlink[i + 2])
+            and "Hyperlink to Above    Back to Top" in _combine(paragraph_list, i)
         ):
             begin_reading = True
             continue
 
         if begin_reading:
-            end_of_article = "Back to Top" in paragraph
+            end_of_article = "Back to Top" in markers
 
-            # Check if the combined paragraph matches the pattern
-            match = re.match(pattern, combined_paragraph.strip())
+            # Check if the current paragraph combined with the next two matches the pattern,
+            # which can only start with a digit, unless there is already a title
+            match = None
+            head = paragraph.lstrip()
+            if not title and (not head or head[0].isdigit()):
+                combined_paragraph = _combine(paragraph_list, i).strip()
+                if combined_paragraph[:1].isdigit():
+                    match = _TITLE_RE.match(combined_paragraph)
 
             if match and not title:
                 # If a match is found, set the title
@@ -73,45 +95,56 @@ def get_content(paragraph_list, pattern):
                 article = (title, content_blob.strip())
                 # append the article to the results list
                 results.append(article)
+                if len(results) == max_articles:
+                    break
                 title = None
                 continue
 
     return results
 
 
-def parse_pdf(file_path):
+def parse_pdf(file_path, as_records=False, max_articles=None):
     """
     Parses the PDF at the given file path, extracts relevant data, and returns it as a DataFrame.
     Args:
         file_path (str): The path to the PDF file to be parsed.
+        as_records (bool, optional): Whether to return the articles as a list of
+            (title, article text) tuples instead of building a DataFrame. Defaults to False.
+        max_articles (int, optional): Only return the first max_articles articles, and stop
+            scanning the paragraphs once they are found. Defaults to None, returning all the
+            articles.
     Returns:
-        pd.DataFrame: The DataFrame containing the extracted data.
+        pd.DataFrame or list: The DataFrame containing the extracted data, or the list of
+            (title, article text) tuples if as_records is True.
     """
-    # Define the regex pattern for matching titles
-
-    pattern = (
-        r"(\d+\.\d+) - (.+?): (.+) \((\d{1,2}\s(?:[A-Za-z]+))"
-        r",( [\w ,-]+)?( \d+.?\w+ uvm;)?( [\w ,-]+)?\)"
-    )
     articles = None
 
     # Use the 'with' statement to open the PDF file
     with pymupdf.open(file_path) as pdf_document:
-        paragraphs = ""
-        paragraph_list = []
-
-        # Iterate through each page
-        for _, page in enumerate(pdf_document):
-            # Extract text from the page
-            paragraphs += page.get_text()
-            # Split the text into individual paragraphs
-            # paragraph_list.append(paragraphs.split("\n"))
-            # # Iterate through the paragraphs to find matches
-            # articles = get_content(paragraph_list, pattern)
+        paragraph_list = [""]
+
+        # Iterate through each page. get_content works on lines of text, so the text blocks of
+        # the page aren't used as paragraphs: a block can hold a title or "Back to Top" together
+        # with article text.
+        for page in pdf_document:
+            # Split the text of the page into individual paragraphs. The first one continues the
+            # last paragraph of the previous page, as if the pages' text had been concatenated.
+            page_paragraphs = page.get_text().split("\n")
+            paragraph_list[-1] += page_paragraphs[0]
+            paragraph_list.extend(page_paragraphs[1:])
+
+        # The last article found is dropped below, so scan for one more than is returned
+        articles = get_content(
+            paragraph_list,
+            max_articles=max_articles + 1 if max_articles is not None else None,
+        )
 
-        paragraph_list = paragraphs.split("\n")
-        articles = get_content(paragraph_list, pattern)
+    # The last article of the document is incomplete (or, when scanning stopped early, one more
+    # than was asked for), drop it in place rather than copying the list
+    if articles:
+        articles.pop()
 
-    result = extract_objects_from_paragraphs(articles[:-1])
+    if as_records:
+        return articles
 
-    return result
+    return extract_objects_from_paragraphs(articles)
@@ -0,0 +1,23 @@
+import sqlite3
+
+import pytest
+
+
+def test_empty_title_rows_with_different_text_survive_across_chunks(tmp_path):
+    data_cleaning = pytest.importorskip("src.processors.data_cleaning")
+    pd = pytest.importorskip("pandas")
+
+    db_path = str(tmp_path / "articles.sqlite")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE articles (Title TEXT, Article_Text TEXT)")
+        conn.executemany(
+            "INSERT INTO articles VALUES (?, ?)",
+            [("", "First text"), ("", "Second text"), ("Title", "Third text")],
+        )
+    conn.close()
+
+    chunks = data_cleaning.clean_article_data_from(sqlite_path=db_path, chunksize=1)
+    df = pd.concat(list(chunks), ignore_index=True)
+
+    assert df["Title"].tolist() == ["", "", "Title"]
+    assert df["Article_Text"].tolist() == ["First text", "Second text", "Third text"]
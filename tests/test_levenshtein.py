@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+
+def _random_titles(rng, count, max_length):
+    # A small alphabet keeps the titles similar enough to share long subsequences
+    alphabet = "abcde é-"
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(0, max_length)))
+        for _ in range(count)
+    ]
+
+
+def _assert_matches_rapidfuzz(titles):
+    np = pytest.importorskip("numpy")
+    fuzz = pytest.importorskip("rapidfuzz.fuzz")
+    levenshtein = pytest.importorskip("src.processors.levenshtein")
+
+    encoded = levenshtein.encode_titles(titles)
+    candidates = np.arange(len(titles), dtype=np.int64)
+    for i, title in enumerate(titles):
+        expected = [fuzz.ratio(title, other) for other in titles]
+        scores = levenshtein.indel_ratios(encoded, i, candidates)
+        np.testing.assert_allclose(scores, expected, atol=1e-9)
+
+
+def test_indel_ratios_match_rapidfuzz_for_short_titles():
+    _assert_matches_rapidfuzz(_random_titles(random.Random(0), 60, 40))
+
+
+def test_indel_ratios_match_rapidfuzz_across_machine_words():
+    # Titles longer than 64 characters span several words of the bit-parallel kernel
+    titles = _random_titles(random.Random(1), 60, 200)
+    titles += ["x" * 64, "x" * 65, "x" * 128 + "y", ""]
+    _assert_matches_rapidfuzz(titles)
@@ -0,0 +1,68 @@
+import pytest
+
+FIRST_TITLE = "1.1 - Military Times: VA expands care (12 May, 2024)"
+SECOND_TITLE = "1.2 - Stars and Stripes: Clinic opens (13 May, 2024)"
+THIRD_TITLE = "1.3 - Federal News: Budget passes (14 May, 2024)"
+
+PAGES = [
+    [
+        "Daily news clips",
+        "Full article text below:",
+        FIRST_TITLE,
+        "Body one of the first article.",
+        "Body two of the first article.",
+        "Back to Top",
+        SECOND_TITLE,
+        "Body one of the second article.",
+    ],
+    [
+        "Body two of the second article.",
+        "Back to Top",
+        THIRD_TITLE,
+        "Body of the last article, which is dropped.",
+        "Back to Top",
+    ],
+]
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    pymupdf = pytest.importorskip("pymupdf")
+    path = tmp_path / "sample.pdf"
+    with pymupdf.open() as document:
+        for lines in PAGES:
+            document.new_page().insert_text((72, 72), "\n".join(lines), fontsize=11)
+        document.save(path)
+    return str(path)
+
+
+def test_parse_pdf_reads_articles_line_by_line(sample_pdf):
+    pdf_parser = pytest.importorskip("src.processors.pdf_parser")
+
+    assert pdf_parser.parse_pdf(sample_pdf, as_records=True) == [
+        (FIRST_TITLE, "Body one of the first article. Body two of the first article."),
+        (
+            SECOND_TITLE,
+            "Body one of the second article. Body two of the second article.",
+        ),
+    ]
+
+
+def test_parse_pdf_matches_concatenated_page_text(sample_pdf):
+    pymupdf = pytest.importorskip("pymupdf")
+    pdf_parser = pytest.importorskip("src.processors.pdf_parser")
+
+    # The paragraphs parse_pdf originally built, from the text of all pages concatenated
+    with pymupdf.open(sample_pdf) as document:
+        paragraphs = "".join(page.get_text() for page in document).split("\n")
+    expected = pdf_parser.get_content(paragraphs)[:-1]
+
+    assert pdf_parser.parse_pdf(sample_pdf, as_records=True) == expected
+
+
+def test_parse_pdf_stops_after_max_articles(sample_pdf):
+    pdf_parser = pytest.importorskip("src.processors.pdf_parser")
+
+    full = pdf_parser.parse_pdf(sample_pdf, as_records=True)
+    assert pdf_parser.parse_pdf(sample_pdf, as_records=True, max_articles=1) == full[:1]
+    assert pdf_parser.parse_pdf(sample_pdf, as_records=True, max_articles=5) == full